@@ -1,11 +1,23 @@
 import csv
+import threading
 from datetime import datetime
-from flask import Flask, render_template, request, redirect, url_for, jsonify
-import pickle
-import pandas as pd
-import numpy as np
+from flask import Flask, g, render_template, request, redirect, url_for, jsonify
 import os
 from chatbot import chatbot_response
+from cohort_analytics import SNAPSHOT_PATH, cached_insights
+from drift_monitor import REFERENCE_PATHS, load_monitor
+from feature_schema import PERFORMANCE_SCHEMA, PLACEMENT_SCHEMA
+from assets import init_assets
+from model_bundle import SchemaMismatchError
+from page_cache import StaticPageCache
+from prediction_cache import PredictionCache, PlacementLookupTable
+from rate_limit import LoadShedder, backend_from_env, init_rate_limiting
+from scorer import load_portable
+from similar_students import INDEXES, MAX_K, build_index
+from tenants import (
+    DEFAULT_TENANT, TenantRegistry, TenantUnavailable, approx_nbytes, tenant_cohorts, tenant_exists, tenant_log, tenant_path
+)
+from whatif import PLACEMENT_FEATURES, simulate
 
 app = Flask(__name__)
 
@@ -16,17 +28,182 @@ app = Flask(__name__)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # --------------------------------------------------
-# LOAD MODELS
+# STATIC ASSETS (python build_assets.py → static/dist)
 # --------------------------------------------------
-performance_model = pickle.load(open(os.path.join(BASE_DIR, "model.pkl"), "rb"))
-placement_model = pickle.load(open(os.path.join(BASE_DIR, "models", "placement_model.pkl"), "rb"))
+init_assets(app, os.path.join(BASE_DIR, "static", "dist"))
 
-CSV_FILE = "student_predictions.csv"
+# --------------------------------------------------
+# PRE-RENDERED PAGES (TEMPLATES WITHOUT VARIABLES)
+# --------------------------------------------------
+page_cache = StaticPageCache(compress=os.environ.get("PAGE_CACHE_GZIP", "1") == "1")
+
+# --------------------------------------------------
+# LOAD MODELS (LAZILY, PER TENANT)
+#   Importing app.py loads neither model (nor sklearn). gunicorn loads
+#   the TENANT_PRELOAD tenants in the master before forking
+#   (gunicorn.conf.py), `python app.py` at startup, and anything else on
+#   the tenant's first prediction. The numpy-only artifacts are used
+#   when they match the pickle (scorer.load_portable).
+# --------------------------------------------------
+PERFORMANCE_MODEL_PATH = os.path.join(BASE_DIR, "model.pkl")
+PERFORMANCE_COMPACT_PATH = os.path.join(BASE_DIR, "model.compact.npz")
+PLACEMENT_MODEL_PATH = os.path.join(BASE_DIR, "models", "placement_model.pkl")
+PLACEMENT_SCORER_PATH = os.path.join(BASE_DIR, "models", "placement_model.scorer.npz")
+
+
+# --------------------------------------------------
+# TENANTS (ONE POOL OF WORKERS, MANY COLLEGES)
+#   Behind a proxy, set TENANT_HEADER (e.g. X-Tenant) and have the proxy
+#   set it per college hostname, overwriting any client value; the
+#   college then comes only from that header. Without it, ?tenant= picks
+#   the college (development / single-college setups). Absent means
+#   "default" (the repo root). Each tenant's models, neighbour indexes
+#   and drift windows are loaded on first use and the least recently
+#   used tenants are dropped past TENANT_MAX_LOADED tenants or
+#   TENANT_MEMORY_BUDGET_MB.
+# --------------------------------------------------
+TENANT_HEADER = os.environ.get("TENANT_HEADER", "")
+# /api/tenants lists every loaded college; ops only
+TENANT_ADMIN_API = os.environ.get("TENANT_ADMIN_API") == "1"
+TENANT_MAX_LOADED = int(os.environ.get("TENANT_MAX_LOADED", 8))
+TENANT_MEMORY_BUDGET_MB = float(os.environ.get("TENANT_MEMORY_BUDGET_MB", 256))
+TENANT_RETRY_SECONDS = float(os.environ.get("TENANT_RETRY_SECONDS", 30))
+# loaded (and never evicted) before gunicorn forks its workers
+PRELOAD_TENANTS = [
+    t.strip() for t in os.environ.get("TENANT_PRELOAD", DEFAULT_TENANT).split(",") if t.strip()
+]
+
+DRIFT_WINDOW = int(os.environ.get("DRIFT_WINDOW", 1000))
+DRIFT_INTERVAL = float(os.environ.get("DRIFT_INTERVAL", 10))
+
+
+def load_drift_monitor(tenant, name):
+    # live window vs the training histograms, per process
+    try:
+        return load_monitor(
+            name, tenant_path(tenant, REFERENCE_PATHS[name]), window=DRIFT_WINDOW, interval=DRIFT_INTERVAL
+        )
+    except (OSError, SchemaMismatchError) as e:
+        app.logger.warning("drift monitoring disabled for %s/%s: %s", tenant, name, e)
+        return None
+
+
+def load_tenant(tenant):
+    performance = load_portable(
+        tenant_path(tenant, PERFORMANCE_COMPACT_PATH), PERFORMANCE_SCHEMA,
+        tenant_path(tenant, PERFORMANCE_MODEL_PATH)
+    )
+    placement = load_portable(
+        tenant_path(tenant, PLACEMENT_SCORER_PATH), PLACEMENT_SCHEMA,
+        tenant_path(tenant, PLACEMENT_MODEL_PATH)
+    )
+
+    # Optional: score placement inputs by table lookup instead of the model
+    table = None
+    if os.environ.get("PLACEMENT_LOOKUP_TABLE") == "1":
+        table = PlacementLookupTable(getattr(placement, "estimator", placement))
+
+    return {
+        "performance": performance,
+        "placement": placement,
+        "placement_table": table,
+        "drift": {
+            "placement": load_drift_monitor(tenant, "placement"),
+            "performance": load_drift_monitor(tenant, "performance")
+        },
+        "similar": {},  # built on first use, see similar_index()
+        # per tenant, so one college's slow first build never blocks another's
+        "similar_lock": threading.Lock()
+    }
+
+
+def tenant_nbytes(state):
+    models = (state["performance"], state["placement"], state["placement_table"])
+    return (
+        sum(approx_nbytes(model) for model in models)
+        + sum(index.nbytes() for index in list(state["similar"].values()))
+    )
+
+
+tenant_registry = TenantRegistry(
+    load_tenant,
+    tenant_nbytes,
+    max_tenants=TENANT_MAX_LOADED,
+    max_bytes=int(TENANT_MEMORY_BUDGET_MB * 1024 * 1024) if TENANT_MEMORY_BUDGET_MB else None,
+    retry_after=TENANT_RETRY_SECONDS
+)
+
+
+def load_models(tenant=DEFAULT_TENANT):
+    """Return the tenant's {"performance", "placement", "placement_table", ...}, loading on first use."""
+    return tenant_registry.get(tenant)
 
-def save_to_csv(row):
-    file_exists = os.path.isfile(CSV_FILE)
 
-    with open(CSV_FILE, mode="a", newline="", encoding="utf-8") as f:
+@app.before_request
+def resolve_tenant():
+    if TENANT_HEADER:
+        # set by the proxy; a client-supplied ?tenant= is ignored
+        tenant = request.headers.get(TENANT_HEADER) or DEFAULT_TENANT
+    else:
+        tenant = request.args.get("tenant") or DEFAULT_TENANT
+    if not tenant_exists(tenant):
+        return jsonify({"error": f"unknown tenant {tenant!r}"}), 404
+    g.tenant = tenant
+
+
+@app.errorhandler(TenantUnavailable)
+def tenant_unavailable(e):
+    # details (missing / mismatched artifacts) go to the log, not the client;
+    # requests during the retry backoff have no new failure to log
+    if e.__cause__ is not None:
+        app.logger.error("%s: %s", e, e.__cause__)
+    response = jsonify({"error": f"college {e.tenant!r} is temporarily unavailable"})
+    response.status_code = 503
+    response.headers["Retry-After"] = str(max(1, round(e.retry_after)))
+    return response
+
+
+# --------------------------------------------------
+# "STUDENTS LIKE YOU" INDEXES (LAZY, REFRESHED FROM THE CSV SOURCES)
+# --------------------------------------------------
+SIMILAR_REFRESH_SECONDS = float(os.environ.get("SIMILAR_REFRESH_SECONDS", 30))
+
+def similar_index(name, tenant=DEFAULT_TENANT):
+    state = load_models(tenant)
+    indexes = state["similar"]
+    index = indexes.get(name)
+    if index is None:
+        with state["similar_lock"]:
+            index = indexes.get(name)
+            if index is None:
+                index = indexes[name] = build_index(name, tenant_cohorts(tenant))
+                tenant_registry.resize(tenant)
+    # picks up rows other workers appended to the prediction log
+    index.refresh(INDEXES[name][2], min_interval=SIMILAR_REFRESH_SECONDS)
+    return index
+
+
+def record_drift(state, name, features):
+    monitor = state["drift"][name]
+    if monitor is not None:
+        monitor.record(features)
+
+
+# --------------------------------------------------
+# PREDICTION CACHE (KEYED BY MODEL VERSION + FEATURES)
+# --------------------------------------------------
+CACHE_SIZE = int(os.environ.get("PREDICTION_CACHE_SIZE", 4096))
+CACHE_TTL = float(os.environ["PREDICTION_CACHE_TTL"]) if os.environ.get("PREDICTION_CACHE_TTL") else None
+
+performance_cache = PredictionCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+placement_cache = PredictionCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+
+def save_to_csv(row, tenant=DEFAULT_TENANT):
+    # one prediction log per tenant (PREDICTION_LOG for the default one)
+    csv_file = tenant_log(tenant)
+    file_exists = os.path.isfile(csv_file)
+
+    with open(csv_file, mode="a", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=row.keys())
 
         if not file_exists:
@@ -36,10 +213,72 @@ def save_to_csv(row):
 
 
 # --------------------------------------------------
-# GLOBAL STATE (CHATBOT CONTEXT)
+# RATE LIMITING + LOAD SHEDDING
+# --------------------------------------------------
+PREDICT_RATE = float(os.environ.get("RATE_LIMIT_PREDICT_PER_SEC", 2))
+CHAT_RATE = float(os.environ.get("RATE_LIMIT_CHAT_PER_SEC", 1))
+RATE_BURST = int(os.environ.get("RATE_LIMIT_BURST", 10))
+
+def default_max_in_flight():
+    # in_flight counts requests holding a worker thread, so it can never
+    # pass the gunicorn thread count: shed once every other thread is busy
+    # (gthread; sync workers rely on the latency / X-Request-Start signals)
+    if os.environ.get("GUNICORN_WORKER_CLASS") == "gevent":
+        return 32
+    return max(1, int(os.environ.get("GUNICORN_THREADS", 4)) - 1)
+
+
+load_shedder = LoadShedder(
+    max_in_flight=int(os.environ.get("SHED_MAX_IN_FLIGHT") or default_max_in_flight()),
+    latency_threshold=float(os.environ.get("SHED_LATENCY_MS", 250)) / 1000
+)
+
+init_rate_limiting(
+    app,
+    backend_from_env(),
+    limits={
+        "predict": (PREDICT_RATE, RATE_BURST),
+        "placement_predict": (PREDICT_RATE, RATE_BURST),
+        "placement_whatif": (PREDICT_RATE * 2, RATE_BURST * 2),
+        "placement_similar": (PREDICT_RATE * 2, RATE_BURST * 2),
+        "performance_similar": (PREDICT_RATE * 2, RATE_BURST * 2),
+        "chat_api": (CHAT_RATE, RATE_BURST),
+        "chat": (CHAT_RATE, RATE_BURST)
+    },
+    shedder=load_shedder,
+    shed_endpoints={
+        "predict", "placement_predict", "placement_whatif",
+        "placement_similar", "performance_similar", "chat_api", "chat"
+    },
+    trust_proxy=os.environ.get("RATE_LIMIT_TRUST_PROXY") == "1"
+)
+
+# --------------------------------------------------
+# MODEL SCORING (CACHE MISS PATH)
+# --------------------------------------------------
+def score_performance(model, features):
+    return int(model.predict(features)[0])
+
+
+def score_placement(models, features):
+    model, table = models["placement"], models["placement_table"]
+    scored = table.lookup(features) if table is not None else None
+    if scored is not None:
+        raw = scored[1]
+    else:
+        raw = model.predict_proba(features)[0][1]
+
+    # report the calibrated probability and decide on it
+    prob = float(model.calibrate(raw))
+    return int(prob >= 0.5), prob
+
+
+# --------------------------------------------------
+# GLOBAL STATE (CHATBOT CONTEXT, PER TENANT)
 # --------------------------------------------------
-last_prediction = None            # 0 or 1
-last_placement_prediction = None  # 0 or 1
+last_prediction = {}            # tenant -> 0 or 1
+last_placement_prediction = {}  # tenant -> 0 or 1
+last_placement_similar = {}     # tenant -> neighbours of the last placement input
 
 # --------------------------------------------------
 # ROOT → WELCOME PAGE
@@ -53,36 +292,33 @@ def root():
 # --------------------------------------------------
 @app.route("/welcome")
 def welcome():
-    return render_template("welcome.html")
+    return page_cache.serve("welcome.html")
 
 # --------------------------------------------------
 # STUDENT PERFORMANCE PAGE
 # --------------------------------------------------
 @app.route("/performance")
 def performance_page():
-    return render_template("index.html")
+    return page_cache.serve("index.html")
 
 # --------------------------------------------------
 # PERFORMANCE PREDICTION
 # --------------------------------------------------
 @app.route("/predict", methods=["POST"])
 def predict():
-    global last_prediction
-
-    attendance = int(request.form["attendance"])
-    study_hours = int(request.form["study_hours"])
-    internal_marks = int(request.form["internal_marks"])
-    assignment_score = int(request.form["assignment_score"])
-
-    input_data = pd.DataFrame([{
-        "attendance": attendance,
-        "study_hours": study_hours,
-        "internal_marks": internal_marks,
-        "assignment_score": assignment_score
-    }])
-
-    prediction = performance_model.predict(input_data)[0]
-    last_prediction = prediction
+    features, errors = PERFORMANCE_SCHEMA.parse(request.form)
+    if errors:
+        return render_template("index.html", errors=errors), 400
+
+    attendance, study_hours, internal_marks, assignment_score = features
+    state = load_models(g.tenant)
+    record_drift(state, "performance", features)
+    model = state["performance"]
+    prediction = performance_cache.get_or_compute(
+        (model.version, features),
+        lambda: score_performance(model, features)
+    )
+    last_prediction[g.tenant] = prediction
 
     result = "PASS" if prediction == 1 else "FAIL"
 
@@ -103,7 +339,7 @@ def predict():
         "backlogs": "",
         "placement_result": "",
         "placement_probability": ""
-    })
+    }, g.tenant)
 
     return render_template("index.html", prediction_text=result)
 
@@ -113,32 +349,31 @@ def predict():
 # --------------------------------------------------
 @app.route("/placement")
 def placement_page():
-    return render_template("placement.html")
+    return page_cache.serve("placement.html")
 
 # --------------------------------------------------
 # PLACEMENT PREDICTION
 # --------------------------------------------------
 @app.route("/placement_predict", methods=["POST"])
 def placement_predict():
-    global last_placement_prediction
-
-    cgpa = float(request.form["cgpa"])
-    internships = int(request.form["internships"])
-    projects = int(request.form["projects"])
-    aptitude = int(request.form["aptitude"])
-    skills = int(request.form["skills"])
-    communication = int(request.form["communication"])
-    backlogs = int(request.form["backlogs"])
-
-    data = np.array([
-        cgpa, internships, projects,
-        aptitude, skills, communication, backlogs
-    ]).reshape(1, -1)
-
-    pred = placement_model.predict(data)[0]
-    prob = placement_model.predict_proba(data)[0][1] * 100
+    features, errors = PLACEMENT_SCHEMA.parse(request.form)
+    if errors:
+        # echo back only the schema fields, never arbitrary template variables
+        submitted = {name: request.form.get(name, "") for name in PLACEMENT_SCHEMA.names}
+        return render_template("placement.html", errors=errors, **submitted), 400
+
+    cgpa, internships, projects, aptitude, skills, communication, backlogs = features
+    models = load_models(g.tenant)
+    record_drift(models, "placement", features)
+    pred, prob = placement_cache.get_or_compute(
+        (models["placement"].version, features),
+        lambda: score_placement(models, features)
+    )
+    prob = prob * 100
 
-    last_placement_prediction = pred
+    similar = similar_index("placement", g.tenant).neighbours(features, k=5)
+    last_placement_prediction[g.tenant] = pred
+    last_placement_similar[g.tenant] = similar
 
     result = "PLACED" if pred == 1 else "NOT PLACED"
 
@@ -159,11 +394,12 @@ def placement_predict():
         "backlogs": backlogs,
         "placement_result": result,
         "placement_probability": round(prob, 2)
-    })
+    }, g.tenant)
 
     return render_template(
         "placement.html",
         placement_result=f"{result} ({prob:.2f}%)",
+        similar=similar,
         cgpa=cgpa,
         internships=internships,
         projects=projects,
@@ -173,6 +409,81 @@ def placement_predict():
         backlogs=backlogs
     )
 
+# --------------------------------------------------
+# PLACEMENT WHAT-IF SIMULATOR
+# --------------------------------------------------
+@app.route("/api/placement/whatif", methods=["POST"])
+def placement_whatif():
+    data = request.get_json(silent=True)
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "request body must be a JSON object"}), 400
+    features = data.get("features")
+    if not isinstance(features, dict):
+        features = {}
+    vary = data.get("vary") or ["projects", "internships"]
+    ranges = data.get("ranges") or {}
+
+    base, errors = PLACEMENT_SCHEMA.parse(features)
+    if errors:
+        return jsonify({"error": "invalid features", "errors": errors}), 400
+
+    if (
+        not isinstance(vary, list)
+        or not all(isinstance(name, str) and name in PLACEMENT_FEATURES for name in vary)
+        or not 1 <= len(vary) <= 2
+        or len(set(vary)) != len(vary)
+    ):
+        return jsonify({"error": "vary must name one or two distinct placement features"}), 400
+
+    if not isinstance(ranges, dict) or not all(
+        name in PLACEMENT_FEATURES
+        and isinstance(bounds, list) and len(bounds) == 2
+        and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in bounds)
+        for name, bounds in ranges.items()
+    ):
+        return jsonify({"error": "ranges must map placement features to [low, high] numbers"}), 400
+
+    try:
+        result = simulate(load_models(g.tenant)["placement"], [float(v) for v in base], vary, ranges)
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(result)
+
+# --------------------------------------------------
+# "STUDENTS LIKE YOU" API
+# --------------------------------------------------
+def similar_response(name, schema):
+    data = request.get_json(silent=True)
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "request body must be a JSON object"}), 400
+    features = data.get("features")
+    if not isinstance(features, dict):
+        features = {}
+    row, errors = schema.parse(features)
+    if errors:
+        return jsonify({"error": "invalid features", "errors": errors}), 400
+
+    k = data.get("k", 5)
+    if isinstance(k, bool) or not isinstance(k, int) or not 1 <= k <= MAX_K:
+        return jsonify({"error": f"k must be a whole number between 1 and {MAX_K}"}), 400
+
+    return jsonify(similar_index(name, g.tenant).neighbours(row, k))
+
+
+@app.route("/api/placement/similar", methods=["POST"])
+def placement_similar():
+    return similar_response("placement", PLACEMENT_SCHEMA)
+
+
+@app.route("/api/performance/similar", methods=["POST"])
+def performance_similar():
+    return similar_response("performance", PERFORMANCE_SCHEMA)
+
 # --------------------------------------------------
 # STUDENT DASHBOARD
 # --------------------------------------------------
@@ -182,8 +493,8 @@ def student_dashboard():
         "student_dashboard.html",
 
         # predictions (safe)
-        performance_prediction=last_prediction,
-        placement_prediction=last_placement_prediction,
+        performance_prediction=last_prediction.get(g.tenant),
+        placement_prediction=last_placement_prediction.get(g.tenant),
 
         # academic inputs (safe defaults)
         attendance=0,
@@ -206,8 +517,6 @@ def student_dashboard():
 # --------------------------------------------------
 @app.route("/chat_api", methods=["POST"])
 def chat_api():
-    global last_prediction, last_placement_prediction
-
     data = request.get_json(silent=True) or {}
     message = data.get("message", "").strip()
 
@@ -216,8 +525,10 @@ def chat_api():
 
     reply = chatbot_response(
         message,
-        performance_prediction=last_prediction,
-        placement_prediction=last_placement_prediction
+        performance_prediction=last_prediction.get(g.tenant),
+        placement_prediction=last_placement_prediction.get(g.tenant),
+        insights=cached_insights(tenant_path(g.tenant, SNAPSHOT_PATH)),
+        similar=last_placement_similar.get(g.tenant)
     )
 
     # ✅ SAFETY NET
@@ -234,48 +545,115 @@ def chat_api():
 # --------------------------------------------------
 @app.route("/chatbot")
 def chatbot_page():
-    return render_template("chatbot.html")
+    return page_cache.serve("chatbot.html")
 
 @app.route("/chat", methods=["POST"])
 def chat():
     reply = chatbot_response(
         request.form.get("message", ""),
-        performance_prediction=last_prediction,
-        placement_prediction=last_placement_prediction
+        performance_prediction=last_prediction.get(g.tenant),
+        placement_prediction=last_placement_prediction.get(g.tenant),
+        insights=cached_insights(tenant_path(g.tenant, SNAPSHOT_PATH)),
+        similar=last_placement_similar.get(g.tenant)
     )
     return render_template("chatbot.html", chat_response=reply)
 
 
 
+# --------------------------------------------------
+# CACHE STATS
+# --------------------------------------------------
+@app.route("/api/cache_stats")
+def cache_stats():
+    # report what is loaded without triggering a load
+    state = tenant_registry.peek(g.tenant) or {}
+    performance = state.get("performance")
+    placement = state.get("placement")
+    return jsonify({
+        "performance": dict(
+            performance_cache.stats(),
+            model_version=performance.version if performance else None
+        ),
+        "placement": dict(
+            placement_cache.stats(),
+            model_version=placement.version if placement else None,
+            lookup_table=state.get("placement_table") is not None
+        )
+    })
+
+
+@app.route("/api/drift")
+def drift():
+    # stats are recomputed at most every DRIFT_INTERVAL seconds; ?refresh=1 forces it
+    max_age = 0.0 if request.args.get("refresh") == "1" else None
+    # a tenant that isn't loaded has seen no requests in this process
+    state = tenant_registry.peek(g.tenant)
+    monitors = state["drift"] if state else dict.fromkeys(REFERENCE_PATHS)
+    return jsonify({
+        name: monitor.stats(max_age) if monitor is not None else None
+        for name, monitor in monitors.items()
+    })
+
+
+@app.route("/api/tenants")
+def tenants():
+    # not tenant-scoped: off unless TENANT_ADMIN_API=1 (keep it off the
+    # public proxy routes)
+    if not TENANT_ADMIN_API:
+        return jsonify({"error": "not found"}), 404
+    return jsonify(tenant_registry.stats())
+
+
+@app.route("/api/load_stats")
+def load_stats():
+    return jsonify({
+        "shedder": load_shedder.stats(),
+        "rate_limited": app.extensions["rate_limit"]["rejected"]
+    })
+
+
 @app.route("/about")
 def about():
-    return render_template("about.html")
+    return page_cache.serve("about.html")
 
 @app.route("/features")
 def features():
-    return render_template("features.html")
+    return page_cache.serve("features.html")
 
 @app.route("/contact")
 def contact():
-    return render_template("contact.html")
+    return page_cache.serve("contact.html")
 
 @app.route("/get-started")
 def get_started():
-    return render_template("get_started.html")
+    return page_cache.serve("get_started.html")
 
 @app.route("/login")
 def login():
-    return render_template("login.html")
+    return page_cache.serve("login.html")
 
 @app.route("/register")
 def register():
-    return render_template("register.html")
+    return page_cache.serve("register.html")
+
+
+
 
+STATIC_PAGES = [
+    "welcome.html", "index.html", "placement.html", "chatbot.html",
+    "about.html", "features.html", "contact.html",
+    "get_started.html", "login.html", "register.html"
+]
 
+if os.environ.get("PAGE_CACHE_WARM", "1") == "1":
+    page_cache.warm(app, STATIC_PAGES)
 
 
 # --------------------------------------------------
 # RUN APP
 # --------------------------------------------------
 if __name__ == "__main__":
+    # schema mismatches fail here, at startup, not on the first request
+    for tenant in PRELOAD_TENANTS:
+        tenant_registry.pin(tenant)
     app.run(debug=True)
@@ -0,0 +1,85 @@
+import json
+import os
+
+from flask import abort, request, send_from_directory, url_for
+from markupsafe import Markup, escape
+
+# --------------------------------------------------
+# FINGERPRINTED ASSETS (built by build_assets.py)
+# --------------------------------------------------
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+CONTENT_TYPES = {".css": "text/css"}
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+class AssetManifest:
+    """Maps source paths under static/ to their fingerprinted dist variants."""
+
+    def __init__(self, dist_dir):
+        self.dist_dir = dist_dir
+        self.entries = {}
+        manifest_path = os.path.join(dist_dir, "manifest.json")
+        if os.path.isfile(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def url(self, filename):
+        entry = self.entries.get(filename)
+        if entry is None:
+            return url_for("static", filename=filename)
+        return url_for("assets", filename=entry["path"])
+
+    def picture(self, filename, alt="", **attrs):
+        entry = self.entries.get(filename, {})
+        attributes = "".join(
+            f' {name.replace("_", "-")}="{escape(value)}"'
+            for name, value in [("alt", alt)] + sorted(attrs.items())
+        )
+        img = f'<img src="{escape(self.url(filename))}"{attributes}>'
+
+        sources = "".join(
+            f'<source type="image/{fmt}" srcset="{escape(url_for("assets", filename=entry[fmt]))}">'
+            for fmt in ("avif", "webp") if fmt in entry
+        )
+        if not sources:
+            return Markup(img)
+        return Markup(f'<picture style="display: contents">{sources}{img}</picture>')
+
+
+def init_assets(app, dist_dir):
+    manifest = AssetManifest(dist_dir)
+
+    app.jinja_env.globals["asset_url"] = manifest.url
+    app.jinja_env.globals["asset_picture"] = manifest.picture
+
+    @app.route("/assets/<path:filename>")
+    def assets(filename):
+        if filename == "manifest.json":
+            abort(404)
+
+        # serve a pre-compressed sibling when the client accepts it; werkzeug
+        # parses the header into codings with q-values (q=0 means refused)
+        accepted = request.accept_encodings
+        ext = os.path.splitext(filename)[1]
+        encoding = None
+        for name, suffix in ENCODING_SUFFIXES.items():
+            if accepted[name] > 0 and os.path.isfile(os.path.join(dist_dir, filename + suffix)):
+                encoding = name
+                break
+
+        if encoding is None:
+            response = send_from_directory(dist_dir, filename)
+        else:
+            response = send_from_directory(
+                dist_dir, filename + ENCODING_SUFFIXES[encoding],
+                mimetype=CONTENT_TYPES.get(ext)
+            )
+            response.headers["Content-Encoding"] = encoding
+
+        if ext in CONTENT_TYPES:
+            response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE
+        return response
+
+    return manifest
@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# --------------------------------------------------
+# BENCHMARK: DRIFT MONITOR OVERHEAD ON /placement_predict
+# --------------------------------------------------
+REQUESTS = 3000
+
+os.environ.update({
+    "PREDICTION_LOG": os.path.join(tempfile.gettempdir(), "bench_drift_predictions.csv"),
+    "RATE_LIMIT_PREDICT_PER_SEC": "1000000",
+    "RATE_LIMIT_BURST": "1000000",
+    "SHED_MAX_IN_FLIGHT": "1000000",
+})
+
+import app as webapp  # noqa: E402
+from compact_forest import feasible_sample  # noqa: E402
+from feature_schema import PLACEMENT_SCHEMA  # noqa: E402
+
+
+def p50_us(timings):
+    return np.percentile(timings, 50) * 1e6
+
+
+def time_requests(client, forms):
+    timings = []
+    for form in forms:
+        started = time.perf_counter()
+        client.post("/placement_predict", data=form)
+        timings.append(time.perf_counter() - started)
+    return p50_us(timings)
+
+
+if __name__ == "__main__":
+    rows = [tuple(r) for r in feasible_sample(PLACEMENT_SCHEMA, REQUESTS).tolist()]
+    monitor = webapp.load_models()["drift"]["placement"]
+
+    timings = []
+    for row in rows:
+        started = time.perf_counter()
+        monitor.record(row)
+        timings.append(time.perf_counter() - started)
+    record_us = p50_us(timings)
+
+    started = time.perf_counter()
+    monitor.stats(max_age=0)
+    stats_ms = (time.perf_counter() - started) * 1000
+
+    forms = [dict(zip(PLACEMENT_SCHEMA.names, row)) for row in rows]
+    client = webapp.app.test_client()
+    time_requests(client, forms[:100])  # warm up
+    # both passes score every request: the first pass would otherwise
+    # leave all of them in the prediction cache for the second
+    webapp.placement_cache.clear()
+    with_monitor = time_requests(client, forms)
+    webapp.load_models()["drift"]["placement"] = None
+    webapp.placement_cache.clear()
+    without_monitor = time_requests(client, forms)
+
+    print(f"DriftMonitor.record()        p50 {record_us:8.1f} us")
+    print(f"DriftMonitor.stats()             {stats_ms:8.2f} ms (at most every DRIFT_INTERVAL s)")
+    print(f"/placement_predict, monitor  p50 {with_monitor:8.0f} us")
+    print(f"/placement_predict, none     p50 {without_monitor:8.0f} us")
@@ -0,0 +1,126 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --------------------------------------------------
+# BENCHMARK: GUNICORN CONFIGURATIONS
+#   python benchmarks/bench_gunicorn.py
+# --------------------------------------------------
+PORT = 8765
+REQUESTS = 2000
+CONCURRENCY = 32
+
+CONFIGS = [
+    ("sync", {"GUNICORN_WORKER_CLASS": "sync"}),
+    ("gthread x4", {"GUNICORN_WORKER_CLASS": "gthread", "GUNICORN_THREADS": "4"}),
+    ("gthread x8", {"GUNICORN_WORKER_CLASS": "gthread", "GUNICORN_THREADS": "8"}),
+    ("gevent", {"GUNICORN_WORKER_CLASS": "gevent"}),
+]
+
+PLACEMENT_FORM = urlencode({
+    "cgpa": 7.5, "internships": 1, "projects": 2, "aptitude": 70,
+    "skills": 3, "communication": 3, "backlogs": 0
+}).encode()
+CHAT_BODY = json.dumps({"message": "will I get placed?"}).encode()
+
+
+def request_once(i):
+    base = f"http://127.0.0.1:{PORT}"
+    kind = i % 3
+    if kind == 0:
+        req = urllib.request.Request(base + "/features")
+    elif kind == 1:
+        req = urllib.request.Request(base + "/placement_predict", data=PLACEMENT_FORM)
+    else:
+        req = urllib.request.Request(
+            base + "/chat_api", data=CHAT_BODY,
+            headers={"Content-Type": "application/json"}
+        )
+    started = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        resp.read()
+    return time.perf_counter() - started
+
+
+def wait_until_up(proc):
+    for _ in range(200):
+        if proc.poll() is not None:
+            return False
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{PORT}/welcome", timeout=1).read()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def tree_rss_mb(pid):
+    pids = [pid] + [int(p) for p in subprocess.run(
+        ["pgrep", "-P", str(pid)], capture_output=True, text=True
+    ).stdout.split()]
+    total = 0
+    for p in pids:
+        try:
+            with open(f"/proc/{p}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+        except OSError:
+            pass
+    return total / 1024
+
+
+def run_config(name, env):
+    # keep benchmark traffic out of the real prediction log, and measure
+    # raw throughput rather than the rate limiter
+    env = dict(
+        env,
+        PREDICTION_LOG=os.path.join(tempfile.gettempdir(), "bench_predictions.csv"),
+        RATE_LIMIT_PREDICT_PER_SEC="1000000",
+        RATE_LIMIT_CHAT_PER_SEC="1000000",
+        RATE_LIMIT_BURST="1000000",
+        SHED_MAX_IN_FLIGHT="1000000",
+        SHED_LATENCY_MS="1000000"
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+         "--bind", f"127.0.0.1:{PORT}", "--access-logfile", "/dev/null", "wsgi:app"],
+        cwd=ROOT, env=dict(os.environ, **env),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        if not wait_until_up(proc):
+            print(f"{name:12s} failed to start (missing dependency?)")
+            return
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(CONCURRENCY) as pool:
+            latencies = np.array(list(pool.map(request_once, range(REQUESTS))))
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"{name:12s} {REQUESTS / elapsed:8,.0f} req/s  "
+            f"p50 {np.percentile(latencies, 50) * 1000:6.1f} ms  "
+            f"p99 {np.percentile(latencies, 99) * 1000:6.1f} ms  "
+            f"RSS {tree_rss_mb(proc.pid):6.0f} MB"
+        )
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    print(f"{REQUESTS} mixed requests (pages / placement / chat), concurrency {CONCURRENCY}")
+    for name, env in CONFIGS:
+        run_config(name, env)
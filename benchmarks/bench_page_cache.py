@@ -0,0 +1,45 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import render_template
+
+from app import app
+
+# --------------------------------------------------
+# BENCHMARK: JINJA RENDER vs PRE-RENDERED PAGE CACHE
+# --------------------------------------------------
+REQUESTS = 5000
+TEMPLATE = "features.html"
+
+
+@app.route("/_bench/uncached")
+def bench_uncached():
+    return render_template(TEMPLATE)
+
+
+def requests_per_second(client, path, headers=None):
+    client.get(path, headers=headers)  # warm up
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        client.get(path, headers=headers)
+    return REQUESTS / (time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    client = app.test_client()
+    etag = client.get("/features").headers["ETag"]
+
+    results = [
+        ("render_template (no cache)", requests_per_second(client, "/_bench/uncached")),
+        ("page cache (200)", requests_per_second(client, "/features")),
+        ("page cache gzip (200)", requests_per_second(client, "/features", {"Accept-Encoding": "gzip"})),
+        ("page cache If-None-Match (304)", requests_per_second(client, "/features", {"If-None-Match": etag})),
+    ]
+
+    baseline = results[0][1]
+    print(f"{TEMPLATE}, {REQUESTS} requests each (Flask test client)")
+    for name, rps in results:
+        print(f"{name:32s} {rps:9,.0f} req/s  x{rps / baseline:.2f}")
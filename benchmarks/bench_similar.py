@@ -0,0 +1,89 @@
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# --------------------------------------------------
+# BENCHMARK: "STUDENTS LIKE YOU" AT 1M STORED STUDENTS
+#   python benchmarks/bench_similar.py [rows]
+# --------------------------------------------------
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+BUFFERED = 1000   # appended rows waiting for the next rebuild
+QUERIES = 2000
+K = 10
+
+os.environ.update({
+    "PREDICTION_LOG": os.path.join(tempfile.gettempdir(), "bench_similar_predictions.csv"),
+    "RATE_LIMIT_PREDICT_PER_SEC": "1000000",
+    "RATE_LIMIT_BURST": "1000000",
+    "SHED_MAX_IN_FLIGHT": "1000000",
+})
+
+import app as webapp  # noqa: E402
+from compact_forest import feasible_sample  # noqa: E402
+from feature_schema import PLACEMENT_SCHEMA  # noqa: E402
+from similar_students import NeighbourIndex  # noqa: E402
+
+
+def percentiles_us(timings):
+    return np.percentile(timings, 50) * 1e6, np.percentile(timings, 99) * 1e6
+
+
+if __name__ == "__main__":
+    X = feasible_sample(PLACEMENT_SCHEMA, ROWS + BUFFERED, seed=1).astype(np.float64)
+    y = (X[:, 0] + X[:, 3] / 20 - X[:, 6] > 9).astype(int)
+
+    index = NeighbourIndex(PLACEMENT_SCHEMA)
+    started = time.perf_counter()
+    index.add(X[:ROWS], y[:ROWS], "dataset")
+    build_s = time.perf_counter() - started
+    index.add(X[ROWS:], y[ROWS:], "prediction")
+
+    queries = feasible_sample(PLACEMENT_SCHEMA, QUERIES, seed=2).astype(np.float64)
+
+    # exactness against brute force on a few queries
+    mean, std = index._view[0][4], index._view[0][5]
+    Z = (X - mean) / std
+    for q in queries[:5]:
+        expected = np.sort(np.sqrt((((q - mean) / std - Z) ** 2).sum(axis=1)))[:K]
+        assert np.allclose(index.query(q, K)[0], expected)
+
+    timings = []
+    for q in queries:
+        started = time.perf_counter()
+        index.neighbours(q, K)
+        timings.append(time.perf_counter() - started)
+    index_p50, index_p99 = percentiles_us(timings)
+
+    # same index behind the Flask endpoint
+    webapp.load_models()["similar"]["placement"] = index
+    index.refreshed = float("inf")  # keep the synthetic index as is
+    client = webapp.app.test_client()
+    bodies = [
+        {"features": dict(zip(PLACEMENT_SCHEMA.names, map(float, q))), "k": K} for q in queries
+    ]
+    timings = []
+    for body in bodies:
+        started = time.perf_counter()
+        response = client.post("/api/placement/similar", json=body)
+        timings.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.json
+    endpoint_p50, endpoint_p99 = percentiles_us(timings)
+
+    # request overhead alone: a JSON endpoint that does no work
+    timings = []
+    for _ in range(QUERIES):
+        started = time.perf_counter()
+        client.get("/api/load_stats")
+        timings.append(time.perf_counter() - started)
+    overhead_p50, _ = percentiles_us(timings)
+
+    print(f"{ROWS:,} indexed + {BUFFERED:,} buffered students, k={K}, {QUERIES:,} queries")
+    print(f"KD-tree build                {build_s:8.2f} s")
+    print(f"index.neighbours()           p50 {index_p50:7.0f} us   p99 {index_p99:7.0f} us")
+    print(f"POST /api/placement/similar  p50 {endpoint_p50:7.0f} us   p99 {endpoint_p99:7.0f} us")
+    print(f"  (Flask test-client overhead alone: p50 {overhead_p50:.0f} us)")
@@ -0,0 +1,92 @@
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --------------------------------------------------
+# BENCHMARK: APP STARTUP (python -X importtime)
+#   python benchmarks/bench_startup.py
+#   exits non-zero when over budget (override with STARTUP_BUDGET_<NAME>)
+# --------------------------------------------------
+DEFAULT_BUDGETS = {
+    "import_app_ms": 600.0,
+    "load_models_ms": 150.0,
+}
+
+# must not be imported by `import app` or by loading the portable models
+HEAVY_MODULES = ("sklearn", "scipy", "pandas")
+
+RUNS = 5
+TOP = 12
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+PROBE = """
+import sys, time, warnings
+warnings.simplefilter("ignore")
+import app
+started = time.perf_counter()
+app.load_models()
+print((time.perf_counter() - started) * 1000)
+print(",".join(m for m in {heavy!r} if m in sys.modules))
+""".format(heavy=HEAVY_MODULES)
+
+
+def load_budgets():
+    budgets = dict(DEFAULT_BUDGETS)
+    for name in budgets:
+        value = os.environ.get(f"STARTUP_BUDGET_{name.upper()}")
+        if value:
+            budgets[name] = float(value)
+    return budgets
+
+
+def import_profile():
+    """One fresh interpreter: ({module: (self_us, cumulative_us, depth)}, probe output)."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return modules, proc.stdout.splitlines()
+
+
+if __name__ == "__main__":
+    budgets = load_budgets()
+    runs = [import_profile() for _ in range(RUNS)]
+
+    # best run: least noise from the rest of the machine
+    modules, _ = min(runs, key=lambda run: run[0]["app"][1])
+    import_ms = modules["app"][1] / 1000
+    load_ms = min(float(output[0]) for _, output in runs)
+    heavy = sorted({m for _, output in runs for m in output[1].split(",") if m})
+
+    print(f"import app (best of {RUNS}): {import_ms:.1f} ms, load_models(): {load_ms:.1f} ms")
+    print("\nDirect imports by cumulative time")
+    top_level = sorted(
+        ((cumulative, name) for name, (_, cumulative, depth) in modules.items() if depth == 1),
+        reverse=True
+    )
+    for cumulative, name in top_level[:TOP]:
+        print(f"  {name:28s} {cumulative / 1000:8.1f} ms")
+
+    results = {"import_app_ms": import_ms, "load_models_ms": load_ms}
+    over_budget = [name for name, limit in budgets.items() if results[name] > limit]
+
+    print()
+    for name, limit in budgets.items():
+        mark = "❌" if name in over_budget else "✅"
+        print(f"{mark} {name} = {results[name]:.1f} (budget {limit:g})")
+
+    if heavy:
+        print(f"❌ imported by app.py / load_models(): {', '.join(heavy)}")
+    if over_budget or heavy:
+        sys.exit(1)
@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+warnings.simplefilter("ignore")
+
+# --------------------------------------------------
+# BENCHMARK: STREAMLIT MODEL LOADING
+#   cold start       fresh interpreter: imports + model load + one prediction
+#   per interaction  one script rerun after a widget change (AppTest)
+# --------------------------------------------------
+ROW = "[[7.0, 1, 2, 70, 3, 3, 0]]"
+COLD_RUNS = 5
+RERUNS = 30
+
+COLD_START = {
+    "pickle bundle (sklearn)": f"""
+from feature_schema import PLACEMENT_SCHEMA
+from model_bundle import load_bundle
+model = load_bundle("models/placement_model.pkl", PLACEMENT_SCHEMA)
+model.calibrated_proba({ROW})
+""",
+    "portable scorer (numpy)": f"""
+from feature_schema import PLACEMENT_SCHEMA
+from scorer import load_scorer
+model = load_scorer("models/placement_model.scorer.npz", PLACEMENT_SCHEMA)
+model.calibrated_proba({ROW})
+""",
+}
+
+TIMED = """
+import sys, time, warnings
+warnings.simplefilter("ignore")
+started = time.perf_counter()
+{body}
+print((time.perf_counter() - started) * 1000, "sklearn" in sys.modules)
+"""
+
+
+def cold_start(body):
+    timings = []
+    for _ in range(COLD_RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMED.format(body=body)],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.split()
+        timings.append(float(out[0]))
+    return min(timings), out[1] == "True"
+
+
+def legacy_script():
+    """placement_prediction.py as it was: sklearn bundle unpickled on every rerun."""
+    with open(os.path.join(ROOT, "placement_prediction.py"), encoding="utf-8") as f:
+        source = f.read()
+    for old, new in (
+        ("from scorer import load_portable", "from model_bundle import load_bundle"),
+        ("model = load_model()", 'model = load_bundle("models/placement_model.pkl", PLACEMENT_SCHEMA)'),
+    ):
+        # fail here rather than run a half-patched script
+        assert old in source, f"placement_prediction.py no longer contains {old!r}"
+        source = source.replace(old, new)
+    return source
+
+
+def per_interaction(source):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_string(source, default_timeout=30)
+    started = time.perf_counter()
+    at.run()
+    first_ms = (time.perf_counter() - started) * 1000
+
+    timings = []
+    for i in range(RERUNS):
+        at.slider[0].set_value(60 + i % 10)
+        at.button[0].click()
+        started = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - started) * 1000)
+        assert not at.exception, at.exception
+    timings.sort()
+    return first_ms, timings[len(timings) // 2]
+
+
+if __name__ == "__main__":
+    print(f"Cold start (best of {COLD_RUNS} fresh interpreters)")
+    for name, body in COLD_START.items():
+        ms, sklearn_loaded = cold_start(body)
+        print(f"  {name:26s} {ms:8.1f} ms   sklearn imported: {sklearn_loaded}")
+
+    with open(os.path.join(ROOT, "placement_prediction.py"), encoding="utf-8") as f:
+        current = f.read()
+
+    print(f"\nplacement_prediction.py, widget change + predict (AppTest, median of {RERUNS} reruns)")
+    for name, source in (("load per rerun (legacy)", legacy_script()), ("cached scorer", current)):
+        first_ms, rerun_ms = per_interaction(source)
+        print(f"  {name:26s} first run {first_ms:8.1f} ms   rerun {rerun_ms:6.1f} ms")
@@ -0,0 +1,148 @@
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# --------------------------------------------------
+# LOAD TEST: ADMITTED LATENCY UNDER OVERLOAD
+#   python benchmarks/load_test_rate_limit.py
+#   Runs the shipped gunicorn.conf.py (gthread, GUNICORN_THREADS per
+#   worker) with this module as the WSGI app, so requests queue inside
+#   gunicorn the way they do in production.
+# --------------------------------------------------
+PORT = 8766
+WORKERS = 2
+CLIENTS = 64
+DURATION = 8.0
+INFERENCE_COST = 0.02   # simulated model cost per request (seconds)
+
+# guarded runs: 5 req/s per client (burst 5), shed past 100 ms; the
+# in-flight limit is app.py's default for the worker's thread count
+GUARDED_ENV = {
+    "RATE_LIMIT_PREDICT_PER_SEC": "5",
+    "RATE_LIMIT_BURST": "5",
+    "SHED_LATENCY_MS": "100",
+}
+UNPROTECTED_ENV = {
+    "RATE_LIMIT_PREDICT_PER_SEC": "1000000000",
+    "RATE_LIMIT_BURST": "1000000000",
+    "SHED_MAX_IN_FLIGHT": "1000000000",
+    "SHED_LATENCY_MS": "1000000000",
+}
+
+if __name__ != "__main__":
+    # imported by gunicorn (see run()): the app with one slow inference
+    # slot per worker, so each worker saturates like a busy one
+    import app as webapp
+
+    _model_lock = threading.Lock()
+    _placement_model = webapp.load_models()["placement"]
+    _predict_proba = _placement_model.predict_proba
+
+    def slow_predict_proba(X):
+        with _model_lock:
+            time.sleep(INFERENCE_COST)
+            return _predict_proba(X)
+
+    _placement_model.predict_proba = slow_predict_proba
+    app = webapp.app
+
+
+def client(client_no, stop_at, request_start):
+    headers = {"X-Forwarded-For": f"10.0.{client_no // 256}.{client_no % 256}"}
+    results = []
+    while time.perf_counter() < stop_at:
+        # fresh inputs each time so the prediction cache never answers
+        form = urlencode({
+            "cgpa": round(random.uniform(5, 10), 1), "internships": random.randint(0, 10),
+            "projects": random.randint(0, 10), "aptitude": random.randint(0, 100),
+            "skills": random.randint(1, 5), "communication": random.randint(1, 5),
+            "backlogs": random.randint(0, 10)
+        }).encode()
+        if request_start:
+            # what a proxy in front of gunicorn stamps on arrival
+            headers["X-Request-Start"] = f"t={time.time():.6f}"
+        req = urllib.request.Request(f"http://127.0.0.1:{PORT}/placement_predict", data=form, headers=headers)
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=60) as resp:
+                resp.read()
+                status = resp.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        results.append((status, time.perf_counter() - started))
+        if status in (429, 503):
+            time.sleep(0.05)
+    return results
+
+
+def wait_until_up(proc):
+    for _ in range(200):
+        if proc.poll() is not None:
+            return False
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{PORT}/welcome", timeout=1).read()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def run(name, env, request_start=False):
+    env = dict(
+        os.environ,
+        **env,
+        PREDICTION_LOG=os.path.join(tempfile.gettempdir(), "load_test_predictions.csv"),
+        RATE_LIMIT_TRUST_PROXY="1",
+        GUNICORN_WORKERS=str(WORKERS),
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+         "--bind", f"127.0.0.1:{PORT}", "--access-logfile", "/dev/null",
+         "--pythonpath", os.path.join(ROOT, "benchmarks"), "load_test_rate_limit:app"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        if not wait_until_up(proc):
+            print(f"{name:32s} failed to start (missing dependency?)")
+            return
+
+        stop_at = time.perf_counter() + DURATION
+        with ThreadPoolExecutor(CLIENTS) as pool:
+            batches = list(pool.map(lambda n: client(n, stop_at, request_start), range(CLIENTS)))
+        results = [r for batch in batches for r in batch]
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+    admitted = np.array([t for status, t in results if status == 200])
+    limited = sum(1 for status, _ in results if status == 429)
+    shed = sum(1 for status, _ in results if status == 503)
+    print(
+        f"{name:32s} admitted {len(admitted):5d}  429 {limited:6d}  503 {shed:6d}  "
+        f"p50 {np.percentile(admitted, 50) * 1000:7.1f} ms  "
+        f"p99 {np.percentile(admitted, 99) * 1000:7.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    print(
+        f"{CLIENTS} clients for {DURATION:.0f}s each run, {INFERENCE_COST * 1000:.0f} ms per inference, "
+        f"gunicorn.conf.py with {WORKERS} workers"
+    )
+    run("unprotected", UNPROTECTED_ENV)
+    run("rate limit + shedding", GUARDED_ENV)
+    run("rate limit + shedding + queue", GUARDED_ENV, request_start=True)
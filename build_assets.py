@@ -0,0 +1,147 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+from io import BytesIO
+
+from PIL import Image, features
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always written
+    brotli = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+DIST_DIR = os.path.join(STATIC_DIR, "dist")
+MANIFEST_PATH = os.path.join(DIST_DIR, "manifest.json")
+
+# --------------------------------------------------
+# BUILD SETTINGS
+# --------------------------------------------------
+MAX_IMAGE_WIDTH = 1200
+WEBP_QUALITY = 80
+AVIF_QUALITY = 55
+HASH_LENGTH = 10
+
+CSS_FILES = ["style.css"]
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def fingerprinted(relpath, data, ext=None):
+    root, original_ext = os.path.splitext(relpath)
+    return f"{root}.{content_hash(data)}{ext or original_ext}"
+
+
+def write_dist(relpath, data):
+    path = os.path.join(DIST_DIR, relpath)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+# --------------------------------------------------
+# CSS: MINIFY + PRE-COMPRESS
+# --------------------------------------------------
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+def build_css(relpath):
+    with open(os.path.join(STATIC_DIR, relpath), encoding="utf-8") as f:
+        data = minify_css(f.read()).encode("utf-8")
+
+    out = fingerprinted(relpath, data)
+    write_dist(out, data)
+
+    encodings = ["gzip"]
+    write_dist(out + ".gz", gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        write_dist(out + ".br", brotli.compress(data, quality=11))
+        encodings.insert(0, "br")
+
+    return {"path": out, "encodings": encodings}
+
+
+# --------------------------------------------------
+# IMAGES: RESIZE + WEBP/AVIF VARIANTS
+# --------------------------------------------------
+def encode(image, fmt, **options):
+    buffer = BytesIO()
+    image.save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+def build_image(relpath):
+    image = Image.open(os.path.join(STATIC_DIR, relpath))
+    image = image.convert("RGBA" if "A" in image.getbands() or image.mode == "P" else "RGB")
+    if image.width > MAX_IMAGE_WIDTH:
+        height = round(image.height * MAX_IMAGE_WIDTH / image.width)
+        image = image.resize((MAX_IMAGE_WIDTH, height), Image.LANCZOS)
+
+    entry = {"width": image.width, "height": image.height}
+
+    fallback = encode(image, "PNG", optimize=True)
+    entry["path"] = fingerprinted(relpath, fallback)
+    write_dist(entry["path"], fallback)
+
+    webp = encode(image, "WEBP", quality=WEBP_QUALITY, method=6)
+    entry["webp"] = fingerprinted(relpath, webp, ".webp")
+    write_dist(entry["webp"], webp)
+
+    if features.check("avif"):
+        avif = encode(image, "AVIF", quality=AVIF_QUALITY)
+        entry["avif"] = fingerprinted(relpath, avif, ".avif")
+        write_dist(entry["avif"], avif)
+
+    return entry
+
+
+# --------------------------------------------------
+# BUILD
+# --------------------------------------------------
+def build():
+    shutil.rmtree(DIST_DIR, ignore_errors=True)
+    os.makedirs(DIST_DIR)
+
+    manifest = {}
+    for relpath in CSS_FILES:
+        manifest[relpath] = build_css(relpath)
+
+    images_dir = os.path.join(STATIC_DIR, "images")
+    for root, _, files in os.walk(images_dir):
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                relpath = os.path.relpath(os.path.join(root, name), STATIC_DIR).replace(os.sep, "/")
+                manifest[relpath] = build_image(relpath)
+
+    with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    return manifest
+
+
+def report(manifest):
+    for relpath, entry in sorted(manifest.items()):
+        before = os.path.getsize(os.path.join(STATIC_DIR, relpath))
+        variants = [entry["path"]] + [entry[k] for k in ("avif", "webp") if k in entry]
+        variants += [entry["path"] + (".br" if enc == "br" else ".gz") for enc in entry.get("encodings", [])]
+        smallest = min(os.path.getsize(os.path.join(DIST_DIR, v)) for v in variants)
+        print(f"{relpath:35s} {before / 1024:8.1f} KB -> {smallest / 1024:7.1f} KB")
+
+
+if __name__ == "__main__":
+    manifest = build()
+    report(manifest)
+    print(f"✅ Wrote {len(manifest)} assets to {os.path.relpath(DIST_DIR, BASE_DIR)}")
@@ -0,0 +1,137 @@
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from feature_schema import PERFORMANCE_SCHEMA, PLACEMENT_SCHEMA
+from model_bundle import load_bundle
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# --------------------------------------------------
+# COLUMN LAYOUT (dataset/student_prediction.csv)
+# --------------------------------------------------
+PERFORMANCE_COLUMNS = PERFORMANCE_SCHEMA.names
+PLACEMENT_COLUMNS = PLACEMENT_SCHEMA.names
+
+OUTPUT_COLUMNS = (
+    ["timestamp", "name"]
+    + PERFORMANCE_COLUMNS
+    + ["performance_result"]
+    + PLACEMENT_COLUMNS
+    + ["placement_result", "placement_probability"]
+)
+
+# --------------------------------------------------
+# WORKER STATE (MODELS LOADED ONCE PER PROCESS)
+# --------------------------------------------------
+_models = {}
+
+
+def _load_models(performance_path, placement_path):
+    _models["performance"] = load_bundle(performance_path, PERFORMANCE_SCHEMA)
+    _models["placement"] = load_bundle(placement_path, PLACEMENT_SCHEMA)
+
+
+def score_chunk(chunk):
+    """Score one chunk and return it already formatted as CSV text."""
+    performance_model = _models["performance"]
+    placement_model = _models["placement"]
+
+    # rows failing schema validation are written with blank results
+    perf_X = PERFORMANCE_SCHEMA.frame_to_array(chunk, dtype=np.float32)
+    perf_ok, _ = PERFORMANCE_SCHEMA.validate_batch(perf_X)
+    place_X = PLACEMENT_SCHEMA.frame_to_array(chunk, dtype=np.float32)
+    place_ok, _ = PLACEMENT_SCHEMA.validate_batch(place_X)
+
+    out = chunk.reindex(columns=OUTPUT_COLUMNS)
+    out["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+    performance_result = np.full(len(out), "", dtype=object)
+    if perf_ok.any():
+        passed = performance_model.predict(perf_X[perf_ok])
+        performance_result[perf_ok] = np.where(passed == 1, "PASS", "FAIL")
+
+    placement_result = np.full(len(out), "", dtype=object)
+    placement_probability = np.full(len(out), np.nan)
+    if place_ok.any():
+        probs = placement_model.calibrated_proba(place_X[place_ok])
+        placement_result[place_ok] = np.where(probs >= 0.5, "PLACED", "NOT PLACED")
+        placement_probability[place_ok] = np.round(probs * 100, 2)
+
+    out["performance_result"] = performance_result
+    out["placement_result"] = placement_result
+    out["placement_probability"] = placement_probability
+
+    return out.to_csv(index=False, header=False), len(out)
+
+
+# --------------------------------------------------
+# PIPELINE: READ → SCORE (POOL) → WRITE, IN ORDER
+# --------------------------------------------------
+def run(input_path, output_path, chunksize, workers, performance_path, placement_path):
+    # keep a bounded number of chunks in flight so memory stays constant
+    max_in_flight = workers * 2
+    pending = deque()
+    total = 0
+    started = time.perf_counter()
+
+    reader = pd.read_csv(input_path, chunksize=chunksize)
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_load_models,
+        initargs=(performance_path, placement_path)
+    ) as pool, open(output_path, "w", newline="", encoding="utf-8") as out:
+        out.write(",".join(OUTPUT_COLUMNS) + "\n")
+
+        def drain_one():
+            nonlocal total
+            text, rows = pending.popleft().result()
+            out.write(text)
+            total += rows
+            elapsed = time.perf_counter() - started
+            print(f"\r{total:,} rows  {total / elapsed:,.0f} rows/sec", end="", file=sys.stderr)
+
+        for chunk in reader:
+            if "aptitude_score" in chunk.columns and "aptitude" not in chunk.columns:
+                chunk = chunk.rename(columns={"aptitude_score": "aptitude"})
+            pending.append(pool.submit(score_chunk, chunk))
+            if len(pending) >= max_in_flight:
+                drain_one()
+
+        while pending:
+            drain_one()
+
+    elapsed = time.perf_counter() - started
+    print(file=sys.stderr)
+    print(f"✅ Scored {total:,} rows in {elapsed:.2f}s ({total / elapsed if elapsed else 0:,.0f} rows/sec)")
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Stream a student CSV through the performance and placement models."
+    )
+    parser.add_argument("input", help="input CSV with performance and placement columns")
+    parser.add_argument("output", help="output CSV (dataset/student_prediction.csv layout)")
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--performance-model", default=os.path.join(BASE_DIR, "model.pkl"))
+    parser.add_argument("--placement-model", default=os.path.join(BASE_DIR, "models", "placement_model.pkl"))
+    args = parser.parse_args(argv)
+
+    run(
+        args.input, args.output, args.chunksize, args.workers,
+        args.performance_model, args.placement_model
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import numpy as np
+
+# --------------------------------------------------
+# PROBABILITY CALIBRATION (PIECEWISE-LINEAR TABLE)
+#   Fitted at training time, applied at request time with one np.interp.
+# --------------------------------------------------
+PLATT_KNOTS = 101
+
+# (label, lower bound) on the calibrated placement probability
+PLACEMENT_BANDS = (("Low", 0.0), ("Medium", 0.4), ("High", 0.7))
+
+
+def fit_calibration(probs, y, method="isotonic"):
+    """Return {"method", "x", "y"} mapping raw to calibrated probabilities."""
+    probs = np.asarray(probs, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    if method == "isotonic":
+        from sklearn.isotonic import IsotonicRegression
+
+        iso = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip").fit(probs, y)
+        x_knots, y_knots = iso.X_thresholds_, iso.y_thresholds_
+    elif method == "platt":
+        from sklearn.linear_model import LogisticRegression
+
+        logit = np.log(np.clip(probs, 1e-12, 1 - 1e-12) / np.clip(1 - probs, 1e-12, 1))
+        platt = LogisticRegression().fit(logit.reshape(-1, 1), y)
+        x_knots = np.linspace(0.0, 1.0, PLATT_KNOTS)
+        grid = np.log(np.clip(x_knots, 1e-12, 1 - 1e-12) / np.clip(1 - x_knots, 1e-12, 1))
+        y_knots = platt.predict_proba(grid.reshape(-1, 1))[:, 1]
+    else:
+        raise ValueError(f"unknown calibration method: {method}")
+
+    return {
+        "method": method,
+        "x": np.asarray(x_knots, dtype=np.float64).tolist(),
+        "y": np.asarray(y_knots, dtype=np.float64).tolist(),
+    }
+
+
+class Calibrator:
+    def __init__(self, table=None):
+        self.method = table["method"] if table else "identity"
+        self.x = np.asarray(table["x"], dtype=np.float64) if table else None
+        self.y = np.asarray(table["y"], dtype=np.float64) if table else None
+
+    def __call__(self, probs):
+        if self.x is None:
+            return np.asarray(probs, dtype=np.float64)
+        return np.interp(probs, self.x, self.y)
+
+
+# --------------------------------------------------
+# BANDS
+# --------------------------------------------------
+def probability_band(probs, bands=PLACEMENT_BANDS):
+    labels = np.array([label for label, _ in bands], dtype=object)
+    edges = np.array([low for _, low in bands[1:]])
+    return labels[np.digitize(probs, edges)]
@@ -1,5 +1,25 @@
-def chatbot_response(user_message, performance_prediction=None, placement_prediction=None):
+def data_says(lines):
+    """Append cohort statistics (cohort_analytics snapshot) to a reply."""
+    if not lines:
+        return ""
+    return "\n\n📊 **What past students' data says:**\n" + "\n".join(f"• {line}" for line in lines)
+
+
+def students_like_you(similar):
+    """One line about the nearest past students (similar_students index)."""
+    if not similar or not similar["k"]:
+        return ""
+    placed = sum(n["placed"] for n in similar["neighbours"])
+    return (
+        f"\n\n🧑‍🎓 **Students like you:** {placed} of the {similar['k']} most similar "
+        "past students were placed."
+    )
+
+
+def chatbot_response(user_message, performance_prediction=None, placement_prediction=None,
+                     insights=None, similar=None):
     message = user_message.lower()
+    insights = insights or {}
 
     # ---------------- GREETINGS ----------------
     if any(word in message for word in ["hi", "hello", "hey"]):
@@ -15,6 +35,20 @@ def chatbot_response(user_message, performance_prediction=None, placement_predic
             "• How can I improve?"
         )
 
+    # ---------------- COHORT STATISTICS ----------------
+    if any(word in message for word in ["insight", "statistic", "stats", "trend"]):
+        if not insights:
+            return (
+                "⚠️ **No cohort statistics yet**\n\n"
+                "Run `python cohort_analytics.py` to build them from past data."
+            )
+        return (
+            "📊 **Placement Insights**\n"
+            + "\n".join(f"• {line}" for line in insights.get("placement", []))
+            + "\n\n📊 **Performance Insights**\n"
+            + "\n".join(f"• {line}" for line in insights.get("performance", []))
+        )
+
     # ---------------- PERFORMANCE ----------------
     if "pass" in message or "performance" in message:
         if performance_prediction is None:
@@ -34,7 +68,7 @@ def chatbot_response(user_message, performance_prediction=None, placement_predic
                 "**Keep doing:**\n"
                 "• Maintain attendance above 75%\n"
                 "• Study consistently every day"
-            )
+            ) + data_says(insights.get("performance"))
         else:
             return (
                 "❌ **Academic Performance: FAIL**\n\n"
@@ -47,7 +81,7 @@ def chatbot_response(user_message, performance_prediction=None, placement_predic
                 "• Increase daily study hours\n"
                 "• Focus on weak subjects\n"
                 "• Improve assignment scores"
-            )
+            ) + data_says(insights.get("performance"))
 
     # ---------------- PLACEMENT ----------------
     if any(word in message for word in ["place", "placement", "job"]):
@@ -69,7 +103,7 @@ def chatbot_response(user_message, performance_prediction=None, placement_predic
                 "• Continue building projects\n"
                 "• Practice mock interviews\n"
                 "• Apply early to companies"
-            )
+            ) + students_like_you(similar) + data_says(insights.get("placement"))
         else:
             return (
                 "⚠️ **Placement Prediction: AT RISK**\n\n"
@@ -82,7 +116,7 @@ def chatbot_response(user_message, performance_prediction=None, placement_predic
                 "• Work on 2–3 strong projects\n"
                 "• Improve aptitude & coding\n"
                 "• Reduce backlogs if any"
-            )
+            ) + students_like_you(similar) + data_says(insights.get("placement"))
 
     # ---------------- IMPROVEMENT ----------------
     if any(word in message for word in ["improve", "suggest", "advice"]):
@@ -96,7 +130,7 @@ def chatbot_response(user_message, performance_prediction=None, placement_predic
             "• Build real-world projects\n"
             "• Practice aptitude weekly\n"
             "• Improve communication skills"
-        )
+        ) + data_says(insights.get("performance", [])[:1] + insights.get("placement", [])[:2])
 
     # ---------------- DEFAULT ----------------
     return (
@@ -104,6 +138,7 @@ def chatbot_response(user_message, performance_prediction=None, placement_predic
         "**You can ask me:**\n"
         "• Will I pass?\n"
         "• Will I get placed?\n"
-        "• How can I improve placement?\n\n"
+        "• How can I improve placement?\n"
+        "• Show placement insights\n\n"
         "💡 Tip: Ask short, clear questions like ChatGPT 😊"
     )
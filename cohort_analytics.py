@@ -0,0 +1,490 @@
+import hashlib
+import io
+import json
+import math
+import os
+import tempfile
+from datetime import datetime
+
+import numpy as np
+
+from feature_schema import PERFORMANCE_SCHEMA, PLACEMENT_SCHEMA
+
+# --------------------------------------------------
+# COHORT ANALYTICS (STREAMING, SNAPSHOTTED)
+#   python cohort_analytics.py    -> reports/cohort_snapshot.json
+#   Each run only reads rows appended since the previous snapshot.
+# --------------------------------------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.path.join(BASE_DIR, "reports", "cohort_snapshot.json")
+PREDICTION_LOG = os.path.join(BASE_DIR, os.environ.get("PREDICTION_LOG", "student_predictions.csv"))
+
+SNAPSHOT_FORMAT = 1
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+MAX_BINS = 10
+HEAD_BYTES = 64 * 1024  # prefix hashed to notice a replaced / rotated file
+
+# name -> (csv path, schema, outcome column, positive value, negative value, outcome word)
+COHORTS = {
+    "placement": (
+        os.path.join(BASE_DIR, "dataset", "placement_data.csv"),
+        PLACEMENT_SCHEMA, "placed", "Yes", "No", "placed"
+    ),
+    "performance": (
+        os.path.join(BASE_DIR, "dataset", "student_data.csv"),
+        PERFORMANCE_SCHEMA, "result", "Pass", "Fail", "pass"
+    ),
+    "placement_predictions": (
+        PREDICTION_LOG, PLACEMENT_SCHEMA, "placement_result", "PLACED", "NOT PLACED", "predicted placed"
+    ),
+    "performance_predictions": (
+        PREDICTION_LOG, PERFORMANCE_SCHEMA, "performance_result", "PASS", "FAIL", "predicted pass"
+    ),
+}
+
+
+# --------------------------------------------------
+# MOMENTS + CORRELATION (WELFORD / CHAN BATCH MERGE)
+# --------------------------------------------------
+class RunningMoments:
+    """Mean and co-moment matrix over k columns, updated batch by batch."""
+
+    def __init__(self, k, state=None):
+        self.n = state["n"] if state else 0
+        self.mean = np.array(state["mean"] if state else np.zeros(k), dtype=np.float64)
+        self.comoment = np.array(state["comoment"] if state else np.zeros((k, k)), dtype=np.float64)
+
+    def update(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if not len(X):
+            return
+        n_batch = len(X)
+        batch_mean = X.mean(axis=0)
+        centered = X - batch_mean
+        delta = batch_mean - self.mean
+        total = self.n + n_batch
+        self.comoment += centered.T @ centered + np.outer(delta, delta) * self.n * n_batch / total
+        self.mean += delta * n_batch / total
+        self.n = total
+
+    def std(self):
+        if self.n < 2:
+            return np.zeros(len(self.mean))
+        return np.sqrt(np.diag(self.comoment) / (self.n - 1))
+
+    def correlation(self):
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = self.comoment / np.outer(scale, scale)
+        # constant columns have no defined correlation
+        return np.where(np.isfinite(corr), corr, 0.0)
+
+    def state(self):
+        return {"n": self.n, "mean": self.mean.tolist(), "comoment": self.comoment.tolist()}
+
+
+# --------------------------------------------------
+# QUANTILES (MERGING T-DIGEST)
+# --------------------------------------------------
+class TDigest:
+    """
+    Merging t-digest (Dunning) with the k1 scale function. Centroids near
+    the tails stay small, so extreme quantiles are accurate; small inputs
+    stay exact because no two points ever need merging.
+    """
+
+    def __init__(self, compression=100, state=None):
+        self.compression = compression
+        self.means = np.array(state["means"] if state else [], dtype=np.float64)
+        self.weights = np.array(state["weights"] if state else [], dtype=np.float64)
+        self.min = state["min"] if state else math.inf
+        self.max = state["max"] if state else -math.inf
+        self._buffer = []
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._buffer.append(values)
+        if sum(len(b) for b in self._buffer) > 10 * self.compression:
+            self._compress()
+
+    def _scale(self, q):
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(q, 0.0), 1.0) - 1)
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        means = np.concatenate([self.means, *self._buffer])
+        weights = np.concatenate([self.weights, *(np.ones(len(b)) for b in self._buffer)])
+        self._buffer = []
+
+        order = np.argsort(means, kind="mergesort")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+
+        merged_means, merged_weights = [], []
+        mean, weight = means[0], weights[0]
+        done = 0.0
+        k_left = self._scale(0.0)
+        for m, w in zip(means[1:], weights[1:]):
+            if self._scale((done + weight + w) / total) - k_left <= 1:
+                weight += w
+                mean += (m - mean) * w / weight
+            else:
+                merged_means.append(mean)
+                merged_weights.append(weight)
+                done += weight
+                k_left = self._scale(done / total)
+                mean, weight = m, w
+        merged_means.append(mean)
+        merged_weights.append(weight)
+
+        self.means = np.array(merged_means)
+        self.weights = np.array(merged_weights)
+
+    def quantile(self, q):
+        self._compress()
+        if not len(self.means):
+            return None
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - self.weights / 2
+        positions = np.concatenate([[0.0], centers, [total]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * total, positions, values))
+
+    def state(self):
+        self._compress()
+        return {
+            "means": self.means.tolist(), "weights": self.weights.tolist(),
+            "min": self.min, "max": self.max
+        }
+
+
+# --------------------------------------------------
+# ONE COHORT: (SCHEMA FEATURES, BINARY OUTCOME)
+# --------------------------------------------------
+def feature_bins(feature):
+    """Bin edges: one bin per value for small integer ranges, else ~10 bins."""
+    span = feature.high - feature.low
+    if span / feature.step <= MAX_BINS:
+        width = feature.step
+    else:
+        width = span / MAX_BINS
+        if feature.dtype == "int":
+            width = math.ceil(width)
+    n_bins = int(math.floor(span / width + 1e-9)) + 1
+    return feature.low + width * np.arange(n_bins), width
+
+
+class Cohort:
+    def __init__(self, schema, state=None):
+        self.schema = schema
+        k = len(schema)
+        # last column of the moments is the outcome (point-biserial correlation)
+        self.moments = RunningMoments(k + 1, state and state["moments"])
+        self.digests = [
+            TDigest(state=state and state["digests"][i]) for i in range(k)
+        ]
+        self.bins = [feature_bins(f) for f in schema.features]
+        self.bin_counts = [
+            np.array(state["bin_counts"][i] if state else np.zeros((2, len(edges))), dtype=np.int64)
+            for i, (edges, _) in enumerate(self.bins)
+        ]
+
+    def update(self, X, y):
+        X = np.asarray(X, dtype=np.float64).reshape(-1, len(self.schema))
+        y = np.asarray(y, dtype=np.float64)
+        if not len(X):
+            return
+        self.moments.update(np.column_stack([X, y]))
+        for i, (edges, width) in enumerate(self.bins):
+            self.digests[i].update(X[:, i])
+            index = np.clip(((X[:, i] - edges[0]) / width + 1e-9).astype(int), 0, len(edges) - 1)
+            np.add.at(self.bin_counts[i][0], index, 1)
+            np.add.at(self.bin_counts[i][1], index, y.astype(np.int64))
+
+    def state(self):
+        return {
+            "moments": self.moments.state(),
+            "digests": [d.state() for d in self.digests],
+            "bin_counts": [c.tolist() for c in self.bin_counts],
+        }
+
+    def summary(self):
+        n = self.moments.n
+        corr = self.moments.correlation()
+        std = self.moments.std()
+        features = {}
+        for i, feature in enumerate(self.schema.features):
+            edges, width = self.bins[i]
+            counts, positives = self.bin_counts[i]
+            features[feature.name] = {
+                "label": feature.label or feature.name,
+                "mean": round(float(self.moments.mean[i]), 4),
+                "std": round(float(std[i]), 4),
+                "quantiles": {
+                    f"p{int(q * 100)}": self.digests[i].quantile(q) for q in QUANTILES
+                },
+                "outcome_correlation": round(float(corr[i, -1]), 4),
+                "bins": [
+                    {
+                        "low": round(float(low), 4),
+                        "high": round(float(min(low + width, feature.high)), 4),
+                        "n": int(c),
+                        "rate": round(float(p / c), 4) if c else None,
+                    }
+                    for low, c, p in zip(edges, counts, positives)
+                ],
+                "best_split": best_split(edges, counts, positives),
+            }
+        return {
+            "n": n,
+            "rate": round(float(self.moments.mean[-1]), 4) if n else None,
+            "features": features,
+            "correlation": {
+                "labels": self.schema.names + ["outcome"],
+                "matrix": np.round(corr, 4).tolist(),
+            },
+        }
+
+
+def best_split(edges, counts, positives, min_share=0.1):
+    """Threshold (a bin edge) with the largest outcome-rate gap between sides."""
+    total, total_pos = counts.sum(), positives.sum()
+    min_rows = max(3, int(min_share * total))
+    below_n, below_pos = np.cumsum(counts)[:-1], np.cumsum(positives)[:-1]
+    best = None
+    for i, (n_low, p_low) in enumerate(zip(below_n, below_pos)):
+        n_high = total - n_low
+        if n_low < min_rows or n_high < min_rows:
+            continue
+        rate_low, rate_high = p_low / n_low, (total_pos - p_low) / n_high
+        if best is None or abs(rate_high - rate_low) > abs(best["rate_above"] - best["rate_below"]):
+            best = {
+                "threshold": round(float(edges[i + 1]), 4),
+                "rate_above": round(float(rate_high), 4),
+                "rate_below": round(float(rate_low), 4),
+                "n_above": int(n_high),
+                "n_below": int(n_low),
+            }
+    return best
+
+
+# --------------------------------------------------
+# INCREMENTAL CSV READING
+# --------------------------------------------------
+def _head_sha256(path, offset):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read(min(offset, HEAD_BYTES))).hexdigest()
+
+
+def _read_csv(text, header=None):
+    # pandas' C parser: a pure-Python csv loop takes seconds on a large log
+    import pandas as pd
+
+    if not text.strip():
+        return pd.DataFrame(columns=header or [])
+    return pd.read_csv(
+        io.StringIO(text), header=None if header else "infer", names=header,
+        on_bad_lines="skip", low_memory=False
+    )
+
+
+def read_new_rows(path, source):
+    """
+    DataFrame of the rows appended after ``source["offset"]``. ``reset`` is
+    True when rows read before are no longer in the file (replaced,
+    truncated, removed); the returned rows then start from the top.
+    """
+    offset = source.get("offset", 0) if source else 0
+    if not os.path.isfile(path):
+        return _read_csv(""), {"offset": 0, "head_sha256": None, "header": None}, offset > 0
+
+    reset = offset > 0 and (
+        os.path.getsize(path) < offset or _head_sha256(path, offset) != source.get("head_sha256")
+    )
+    if reset:
+        offset = 0
+
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    # leave a partially written last line for the next run
+    data = data[:data.rfind(b"\n") + 1]
+    text = data.decode("utf-8")
+
+    if offset == 0:
+        rows = _read_csv(text)
+        header = [str(column) for column in rows.columns] or None
+    else:
+        header = source["header"]
+        rows = _read_csv(text, header)
+
+    offset += len(data)
+    return rows, {"offset": offset, "head_sha256": _head_sha256(path, offset), "header": header}, reset
+
+
+def read_tail_rows(path, n_rows):
+    """DataFrame of the last ``n_rows`` complete rows, read from the end of the file."""
+    if not os.path.isfile(path):
+        return _read_csv("")
+    with open(path, "rb") as f:
+        header = f.readline()
+        if not header.endswith(b"\n"):
+            return _read_csv("")
+        start = len(header)
+        position = f.seek(0, os.SEEK_END)
+        data, chunk = b"", HEAD_BYTES
+        # step back until the tail holds n_rows lines (or the whole body)
+        while position > start and data.count(b"\n") <= n_rows:
+            step = min(chunk, position - start)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+            chunk *= 2
+        if position > start:
+            # position may be mid-line: drop up to the first line break
+            f.seek(position - 1)
+            if f.read(1) != b"\n":
+                data = data[data.find(b"\n") + 1:]
+    data = data[:data.rfind(b"\n") + 1]
+    lines = data.decode("utf-8").splitlines(keepends=True)[-n_rows:]
+    columns = [str(column) for column in _read_csv(header.decode("utf-8")).columns]
+    return _read_csv("".join(lines), columns)
+
+
+def rows_to_arrays(rows, schema, outcome, positive, negative):
+    """(X, y, kept) for rows with a known outcome and schema-valid features."""
+    columns = set(rows.columns)
+    if outcome not in columns or not all(
+        f.name in columns or f.source_column in columns for f in schema.features
+    ):
+        return np.empty((0, len(schema))), np.empty(0), np.empty(0, dtype=np.intp)
+
+    label = rows[outcome].astype(str).str.strip()
+    X = schema.frame_to_array(rows)
+    valid, _ = schema.validate_batch(X)
+    kept = np.flatnonzero(valid & label.isin((positive, negative)).to_numpy())
+    return X[kept], (label.to_numpy()[kept] == positive).astype(np.float64), kept
+
+
+# --------------------------------------------------
+# SNAPSHOT
+# --------------------------------------------------
+def load_snapshot(path=SNAPSHOT_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return snapshot if snapshot.get("format") == SNAPSHOT_FORMAT else None
+
+
+def update_snapshot(path=SNAPSHOT_PATH, cohorts=COHORTS):
+    """Fold new rows from every source into the snapshot and rewrite it."""
+    previous = load_snapshot(path) or {"cohorts": {}}
+    snapshot = {"format": SNAPSHOT_FORMAT, "created": datetime.now().isoformat(timespec="seconds"), "cohorts": {}}
+
+    for name, (source_path, schema, outcome, positive, negative, word) in cohorts.items():
+        entry = previous["cohorts"].get(name)
+        rows, source, reset = read_new_rows(source_path, entry and entry["source"])
+        cohort = Cohort(schema, None if reset or not entry else entry["state"])
+        X, y, _ = rows_to_arrays(rows, schema, outcome, positive, negative)
+        cohort.update(X, y)
+        snapshot["cohorts"][name] = {
+            "schema": schema.name,
+            "outcome": word,
+            "source": dict(source, path=os.path.relpath(source_path, BASE_DIR)),
+            "state": cohort.state(),
+            "summary": cohort.summary(),
+        }
+
+    # unique temp file: the dashboards and the CLI may refresh concurrently
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".cohort_snapshot.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"))
+        os.chmod(tmp_path, 0o644)  # mkstemp creates it owner-only
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return snapshot
+
+
+# --------------------------------------------------
+# INSIGHTS (TEXT FOR DASHBOARDS + CHATBOT)
+# --------------------------------------------------
+def cohort_insights(snapshot, name, limit=3):
+    """[(level, text)] with level in success / warning / info."""
+    cohort = snapshot and snapshot["cohorts"].get(name)
+    if not cohort or not cohort["summary"]["n"]:
+        return []
+    summary, word = cohort["summary"], cohort["outcome"]
+
+    ranked = sorted(
+        summary["features"].values(),
+        key=lambda f: abs(f["outcome_correlation"]),
+        reverse=True
+    )
+    insights = []
+    for feature in ranked:
+        split = feature["best_split"]
+        r = feature["outcome_correlation"]
+        if split is None or abs(r) < 0.1:
+            continue
+        text = (
+            f"{feature['label']} ≥ **{split['threshold']:g}**: "
+            f"**{split['rate_above']:.0%}** {word} vs {split['rate_below']:.0%} below "
+            f"(r = {r:+.2f})"
+        )
+        insights.append(("success" if r > 0 else "warning", text))
+        if len(insights) == limit:
+            break
+
+    insights.append((
+        "info",
+        f"Based on **{summary['n']}** students, {summary['rate']:.0%} {word} overall."
+    ))
+    return insights
+
+
+_insights_cache = {}
+
+
+def cached_insights(path=SNAPSHOT_PATH, names=("placement", "performance")):
+    """{cohort: [text]} from the snapshot on disk, re-read only when it changes."""
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return {}
+    cached = _insights_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        snapshot = load_snapshot(path)
+        cached = _insights_cache[path] = (mtime, {
+            name: [text for _, text in cohort_insights(snapshot, name)] for name in names
+        })
+    return cached[1]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from tenants import DEFAULT_TENANT, tenant_cohorts, tenant_path
+
+    parser = argparse.ArgumentParser(description="Update the cohort analytics snapshot.")
+    parser.add_argument("--tenant", default=DEFAULT_TENANT, help="college under tenants/ (default: repo root)")
+    args = parser.parse_args()
+
+    snapshot_path = tenant_path(args.tenant, SNAPSHOT_PATH)
+    snapshot = update_snapshot(snapshot_path, tenant_cohorts(args.tenant))
+    size_kb = os.path.getsize(snapshot_path) / 1024
+    print(f"✅ Snapshot written to {os.path.relpath(snapshot_path)} ({size_kb:.1f} KB)")
+    for name, cohort in snapshot["cohorts"].items():
+        print(f"\n{name}: {cohort['summary']['n']} rows")
+        for level, text in cohort_insights(snapshot, name):
+            print(f"  [{level}] {text.replace('**', '')}")
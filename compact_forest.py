@@ -0,0 +1,255 @@
+import argparse
+import hashlib
+import os
+import time
+
+import numpy as np
+
+from feature_schema import PERFORMANCE_SCHEMA
+from model_bundle import SchemaMismatchError, load_bundle
+
+# --------------------------------------------------
+# COMPACT RANDOM FOREST
+#   All trees flattened into one node table. Leaves point at themselves so
+#   a fixed number of steps (max depth) walks every row to its leaf.
+#   Thresholds on integer features are stored as floor(threshold) in the
+#   smallest integer dtype: for whole-number inputs x <= t == x <= floor(t).
+# --------------------------------------------------
+COMPACT_FORMAT = 1
+
+
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def smallest_int_dtype(low, high):
+    for dtype in (np.int8, np.int16, np.int32, np.int64):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    raise ValueError(f"no integer dtype holds [{low}, {high}]")
+
+
+class CompactForest:
+    """Array-only RandomForest classifier; predictions match the original."""
+
+    def __init__(self, arrays):
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.left = arrays["left"]
+        self.right = arrays["right"]
+        self.value_index = arrays["value_index"]
+        self.values = arrays["values"]
+        self.roots = arrays["roots"]
+        self.depth = int(arrays["depth"])
+        self.classes_ = arrays["classes"]
+        self.features = [str(f) for f in arrays["features"]]
+        self.source_version = str(arrays["source_version"])
+        self.schema_name = str(arrays["schema"])
+
+    @property
+    def version(self):
+        return self.source_version
+
+    def _leaves(self, X):
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != len(self.features):
+            raise SchemaMismatchError(
+                f"{self.schema_name}: expected {len(self.features)} features, got {X.shape[1]}"
+            )
+
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots)))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.value_index[nodes]
+
+    def predict_proba(self, X):
+        leaves = self._leaves(X)
+        # accumulate tree by tree, in order, exactly like RandomForestClassifier
+        proba = np.zeros((leaves.shape[0], self.values.shape[1]), dtype=np.float64)
+        for tree in range(leaves.shape[1]):
+            proba += self.values[leaves[:, tree]]
+        proba /= leaves.shape[1]
+        return proba
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+
+# --------------------------------------------------
+# COMPACTION
+# --------------------------------------------------
+def _compact_tree(tree, schema):
+    """
+    Rebuild one sklearn tree as (feature, threshold, left, right, value)
+    node lists, dropping splits that are decided by the schema ranges and
+    merging splits whose two sides are identical leaves.
+    """
+    value = tree.value[:, 0, :].astype(np.float64)
+    normalizer = value.sum(axis=1, keepdims=True)
+    normalizer[normalizer == 0] = 1
+    value = value / normalizer  # same normalisation as DecisionTreeClassifier.predict_proba
+
+    nodes = []
+
+    def build(node, bounds):
+        feature = tree.feature[node]
+        if tree.children_left[node] == -1:
+            nodes.append([-1, 0, -1, -1, tuple(value[node])])
+            return len(nodes) - 1
+
+        cut = tree.threshold[node]
+        if schema.integer[feature]:
+            cut = np.floor(cut)
+        low, high = bounds[feature]
+        if high <= cut:   # every feasible input goes left
+            return build(tree.children_left[node], bounds)
+        if low > cut:     # every feasible input goes right
+            return build(tree.children_right[node], bounds)
+
+        index = len(nodes)
+        nodes.append([int(feature), cut, None, None, None])
+        left_bounds = dict(bounds)
+        left_bounds[feature] = (low, min(high, cut))
+        right_bounds = dict(bounds)
+        right_bounds[feature] = (max(low, cut + 1 if schema.integer[feature] else cut), high)
+        left = build(tree.children_left[node], left_bounds)
+        right = build(tree.children_right[node], right_bounds)
+
+        left_leaf, right_leaf = nodes[left], nodes[right]
+        if left_leaf[0] == -1 and right_leaf[0] == -1 and left_leaf[4] == right_leaf[4]:
+            del nodes[index:]
+            nodes.append([-1, 0, -1, -1, left_leaf[4]])
+            return index
+
+        nodes[index][2], nodes[index][3] = left, right
+        return index
+
+    bounds = {i: (f.low, f.high) for i, f in enumerate(schema.features)}
+    build(0, bounds)
+    return nodes
+
+
+def compact_forest(bundle, schema, source_path):
+    forest = bundle.estimator
+    feature, threshold, left, right, leaf_values = [], [], [], [], []
+    roots, depth = [], 0
+    unique_values = {}
+
+    for estimator in forest.estimators_:
+        nodes = _compact_tree(estimator.tree_, schema)
+        offset = len(feature)
+        roots.append(offset)
+        depth = max(depth, estimator.tree_.max_depth)
+        for i, (f, t, l, r, v) in enumerate(nodes):
+            leaf = f == -1
+            feature.append(0 if leaf else f)
+            threshold.append(t)
+            left.append(offset + i if leaf else offset + l)
+            right.append(offset + i if leaf else offset + r)
+            leaf_values.append(unique_values.setdefault(v, len(unique_values)) if leaf else 0)
+
+    if schema.integer.all():
+        threshold_dtype = smallest_int_dtype(min(threshold), max(threshold))
+    else:
+        threshold_dtype = np.float64
+    node_dtype = smallest_int_dtype(0, len(feature))
+
+    return {
+        "format": np.int64(COMPACT_FORMAT),
+        "schema": np.str_(schema.name),
+        "features": np.array(schema.columns),
+        "source_version": np.str_(bundle.version),
+        "source_sha256": np.str_(file_sha256(source_path)),
+        "classes": forest.classes_,
+        "depth": np.int64(depth),
+        "roots": np.array(roots, dtype=node_dtype),
+        "feature": np.array(feature, dtype=smallest_int_dtype(0, len(schema))),
+        "threshold": np.array(threshold, dtype=threshold_dtype),
+        "left": np.array(left, dtype=node_dtype),
+        "right": np.array(right, dtype=node_dtype),
+        "value_index": np.array(leaf_values, dtype=smallest_int_dtype(0, len(unique_values))),
+        "values": np.array(list(unique_values), dtype=np.float64),
+    }
+
+
+# --------------------------------------------------
+# SAVE / LOAD
+# --------------------------------------------------
+def save_compact(arrays, path):
+    with open(path, "wb") as f:
+        np.savez(f, **arrays)
+
+
+def load_compact(path, schema, source_path=None):
+    with np.load(path, allow_pickle=False) as data:
+        arrays = {name: data[name] for name in data.files}
+
+    if int(arrays["format"]) != COMPACT_FORMAT:
+        raise SchemaMismatchError(f"{path}: unsupported compact format {arrays['format']}")
+    if [str(f) for f in arrays["features"]] != list(schema.columns):
+        raise SchemaMismatchError(f"{path}: features do not match {schema.name} schema")
+    if source_path is not None and str(arrays["source_sha256"]) != file_sha256(source_path):
+        raise SchemaMismatchError(f"{path}: built from a different {os.path.basename(source_path)}")
+
+    return CompactForest(arrays)
+
+
+# --------------------------------------------------
+# CLI: COMPACT + VERIFY + REPORT
+# --------------------------------------------------
+def feasible_sample(schema, n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = [
+        rng.integers(int(f.low), int(f.high) + 1, n_rows) if f.dtype == "int"
+        else np.round(rng.uniform(f.low, f.high, n_rows), 1)
+        for f in schema.features
+    ]
+    return np.column_stack(columns).astype(np.float32)
+
+
+def timed_load(load, repeats=20):
+    started = time.perf_counter()
+    for _ in range(repeats):
+        load()
+    return (time.perf_counter() - started) / repeats * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compact the performance RandomForest.")
+    parser.add_argument("model", nargs="?", default="model.pkl")
+    parser.add_argument("output", nargs="?", default="model.compact.npz")
+    parser.add_argument("--verify-rows", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    schema = PERFORMANCE_SCHEMA
+    bundle = load_bundle(args.model, schema)
+    save_compact(compact_forest(bundle, schema, args.model), args.output)
+    compact = load_compact(args.output, schema, source_path=args.model)
+
+    X = feasible_sample(schema, args.verify_rows)
+    expected = bundle.predict_proba(X)
+    if not (np.array_equal(expected, compact.predict_proba(X))
+            and np.array_equal(bundle.predict(X), compact.predict(X))):
+        os.remove(args.output)
+        raise SystemExit("❌ Compact model predictions differ; artifact removed")
+
+    original_nodes = sum(e.tree_.node_count for e in bundle.estimator.estimators_)
+    pickle_kb = os.path.getsize(args.model) / 1024
+    compact_kb = os.path.getsize(args.output) / 1024
+    pickle_ms = timed_load(lambda: load_bundle(args.model, schema))
+    compact_ms = timed_load(lambda: load_compact(args.output, schema))
+
+    print(f"✅ Identical predictions on {args.verify_rows:,} feasible inputs")
+    print(f"Nodes      {original_nodes:>10,} -> {len(compact.feature):,}")
+    print(f"Size       {pickle_kb:>9.1f} KB -> {compact_kb:.1f} KB ({pickle_kb / compact_kb:.1f}x smaller)")
+    print(f"Load time  {pickle_ms:>9.2f} ms -> {compact_ms:.2f} ms ({pickle_ms / compact_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
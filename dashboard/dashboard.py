@@ -1,7 +1,17 @@
+import os
+import sys
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cohort_analytics import SNAPSHOT_PATH, cohort_insights, update_snapshot
+from drift_monitor import REFERENCE_PATHS, monitor_from_log
+from drift_section import drift_section
+from tenants import DEFAULT_TENANT, known_tenants, tenant_cohorts, tenant_log, tenant_path
+
 # ---------------------------------------------------
 # PAGE CONFIGURATION
 # ---------------------------------------------------
@@ -38,16 +48,44 @@ st.markdown("""
 st.title("🎓 Student Performance Analytics Dashboard")
 st.caption("📊 Academic insights to track performance, risk & improvement areas")
 
+# ---------------------------------------------------
+# COLLEGE (TENANT)
+# ---------------------------------------------------
+tenants = known_tenants()
+requested = st.query_params.get("tenant", DEFAULT_TENANT)
+tenant = DEFAULT_TENANT
+if len(tenants) > 1:
+    tenant = st.sidebar.selectbox(
+        "🏫 College", tenants, index=tenants.index(requested) if requested in tenants else 0
+    )
+
 # ---------------------------------------------------
 # LOAD DATA
 # ---------------------------------------------------
 @st.cache_data
-def load_data():
-    df = pd.read_csv("dataset/student_data.csv")
+def load_data(tenant):
+    df = pd.read_csv(tenant_cohorts(tenant)["performance"][0])
     df["result"] = df["result"].map({"Pass": "Pass", "Fail": "Fail"})
     return df
 
-df = load_data()
+
+
+@st.cache_data(ttl=300)
+def load_cohorts(tenant):
+    # incremental: only rows appended since the last snapshot are read
+    return update_snapshot(tenant_path(tenant, SNAPSHOT_PATH), tenant_cohorts(tenant))
+
+
+
+@st.cache_data(ttl=60)
+def load_drift(tenant):
+    # last 1000 logged performance requests vs the training histograms
+    return monitor_from_log(
+        "performance", tenant_log(tenant), path=tenant_path(tenant, REFERENCE_PATHS["performance"])
+    ).stats()
+
+df = load_data(tenant)
+cohorts = load_cohorts(tenant)
 
 # ---------------------------------------------------
 # ADVANCED SIDEBAR FILTERS
@@ -258,9 +296,33 @@ st.divider()
 # ---------------------------------------------------
 st.subheader("📌 Key Insights")
 
-st.success("Attendance above **80%** strongly correlates with passing.")
-st.info("Students studying **2+ hours/day** perform significantly better.")
-st.warning("Low internal marks increase failure probability.")
+st.caption("Computed from the full student dataset (python cohort_analytics.py)")
+
+for level, text in cohort_insights(cohorts, "performance"):
+    getattr(st, level)(text)
+
+correlation = cohorts["cohorts"]["performance"]["summary"]["correlation"]
+fig_corr = px.imshow(
+    correlation["matrix"],
+    x=correlation["labels"],
+    y=correlation["labels"],
+    zmin=-1,
+    zmax=1,
+    color_continuous_scale="RdBu",
+    text_auto=".2f",
+    title="Feature Correlations (outcome = pass)"
+)
+fig_corr.update_layout(paper_bgcolor="rgba(0,0,0,0)", font_color="white")
+st.plotly_chart(fig_corr, use_container_width=True)
+
+st.divider()
+
+# ---------------------------------------------------
+# INPUT DRIFT (LOGGED REQUESTS vs TRAINING DATA)
+# ---------------------------------------------------
+drift_section(load_drift(tenant), "performance")
+
+st.divider()
 
 # ---------------------------------------------------
 # DATA DOWNLOAD & VIEW
@@ -0,0 +1,57 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from drift_monitor import MIN_SAMPLES
+
+
+# ---------------------------------------------------
+# INPUT DRIFT SECTION (SHARED BY BOTH DASHBOARDS)
+#   drift: DriftMonitor.stats() for the dashboard's model
+#   noun:  "placement" / "performance", used in the messages
+# ---------------------------------------------------
+def drift_section(drift, noun):
+    st.subheader("📡 Input Drift vs Training Data")
+
+    if drift["status"] == "insufficient data":
+        st.info(f"Not enough logged {noun} predictions yet ({drift['samples']} of {MIN_SAMPLES} needed).")
+        return
+
+    alert = {"stable": st.success, "moderate": st.warning, "major": st.error}[drift["status"]]
+    alert(f"Input drift: **{drift['status']}** over the last **{drift['samples']}** {noun} predictions")
+
+    st.dataframe(
+        pd.DataFrame([
+            {
+                "Feature": f["label"],
+                "PSI": f["psi"],
+                "KS": f["ks"],
+                "KS critical (5%)": f["ks_critical"],
+                "Status": f["status"]
+            }
+            for f in drift["features"].values()
+        ]),
+        use_container_width=True,
+        hide_index=True
+    )
+
+    drift_feature = st.selectbox(
+        "Compare feature distribution",
+        list(drift["features"]),
+        format_func=lambda name: drift["features"][name]["label"]
+    )
+    hist = drift["features"][drift_feature]
+    fig_drift = px.bar(
+        pd.DataFrame({
+            "bin": hist["bin_low"] * 2,
+            "share": hist["reference"] + hist["live"],
+            "data": ["Training"] * len(hist["reference"]) + ["Live"] * len(hist["live"])
+        }),
+        x="bin",
+        y="share",
+        color="data",
+        barmode="group",
+        title=f"{hist['label']}: Training vs Live (PSI {hist['psi']:.3f})"
+    )
+    fig_drift.update_layout(paper_bgcolor="rgba(0,0,0,0)", font_color="white")
+    st.plotly_chart(fig_drift, use_container_width=True)
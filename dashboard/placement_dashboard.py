@@ -1,7 +1,20 @@
+import os
+import sys
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from calibration import PLACEMENT_BANDS, probability_band
+from cohort_analytics import BASE_DIR, SNAPSHOT_PATH, cohort_insights, update_snapshot
+from drift_monitor import REFERENCE_PATHS, monitor_from_log
+from drift_section import drift_section
+from feature_schema import PLACEMENT_SCHEMA
+from scorer import load_portable
+from tenants import DEFAULT_TENANT, known_tenants, tenant_cohorts, tenant_log, tenant_path
+
 # ---------------------------------------------------
 # PAGE CONFIGURATION
 # ---------------------------------------------------
@@ -38,16 +51,57 @@ st.markdown("""
 st.title("🎯 Placement Analytics Dashboard")
 st.caption("📊 Data-driven insights for placement readiness & outcomes")
 
+# ---------------------------------------------------
+# COLLEGE (TENANT)
+# ---------------------------------------------------
+tenants = known_tenants()
+requested = st.query_params.get("tenant", DEFAULT_TENANT)
+tenant = DEFAULT_TENANT
+if len(tenants) > 1:
+    tenant = st.sidebar.selectbox(
+        "🏫 College", tenants, index=tenants.index(requested) if requested in tenants else 0
+    )
+
 # ---------------------------------------------------
 # LOAD DATA
 # ---------------------------------------------------
+@st.cache_resource
+def load_model(tenant):
+    # falls back to the pickle if the scorer wasn't re-exported after a retrain
+    scorer_path = os.path.join(BASE_DIR, "models", "placement_model.scorer.npz")
+    model_path = os.path.join(BASE_DIR, "models", "placement_model.pkl")
+    return load_portable(tenant_path(tenant, scorer_path), PLACEMENT_SCHEMA, tenant_path(tenant, model_path))
+
+
 @st.cache_data
-def load_data():
-    df = pd.read_csv("dataset/placement_data.csv")
+def load_data(tenant):
+    df = pd.read_csv(tenant_cohorts(tenant)["placement"][0])
     df["placed"] = df["placed"].map({"Yes": "Placed", "No": "Not Placed"})
+
+    # one batched, calibrated scoring pass per data load
+    probs = load_model(tenant).calibrated_proba(PLACEMENT_SCHEMA.frame_to_array(df))
+    df["placement_probability"] = (probs * 100).round(2)
+    df["probability_band"] = probability_band(probs)
     return df
 
-df = load_data()
+
+
+@st.cache_data(ttl=300)
+def load_cohorts(tenant):
+    # incremental: only rows appended since the last snapshot are read
+    return update_snapshot(tenant_path(tenant, SNAPSHOT_PATH), tenant_cohorts(tenant))
+
+
+
+@st.cache_data(ttl=60)
+def load_drift(tenant):
+    # last 1000 logged placement requests vs the training histograms
+    return monitor_from_log(
+        "placement", tenant_log(tenant), path=tenant_path(tenant, REFERENCE_PATHS["placement"])
+    ).stats()
+
+df = load_data(tenant)
+cohorts = load_cohorts(tenant)
 
 # ---------------------------------------------------
 # ADVANCED SIDEBAR FILTERS
@@ -159,17 +213,12 @@ st.divider()
 # ---------------------------------------------------
 st.subheader("🎯 Placement Probability Bands")
 
-filtered_df["probability_band"] = pd.cut(
-    filtered_df["cgpa"],
-    bins=[0, 6, 7.5, 10],
-    labels=["Low", "Medium", "High"]
-)
-
 fig_band = px.bar(
     filtered_df,
     x="probability_band",
     color="placed",
-    title="Placement Probability Based on CGPA",
+    title="Calibrated Model Probability Bands",
+    category_orders={"probability_band": [label for label, _ in PLACEMENT_BANDS]},
     color_discrete_map={
         "Placed": "#22c55e",
         "Not Placed": "#ef4444"
@@ -241,10 +290,33 @@ st.divider()
 # KEY INSIGHTS
 # ---------------------------------------------------
 st.subheader("📌 Key Insights")
+st.caption("Computed from the full placement dataset (python cohort_analytics.py)")
+
+for level, text in cohort_insights(cohorts, "placement"):
+    getattr(st, level)(text)
+
+correlation = cohorts["cohorts"]["placement"]["summary"]["correlation"]
+fig_corr = px.imshow(
+    correlation["matrix"],
+    x=correlation["labels"],
+    y=correlation["labels"],
+    zmin=-1,
+    zmax=1,
+    color_continuous_scale="RdBu",
+    text_auto=".2f",
+    title="Feature Correlations (outcome = placed)"
+)
+fig_corr.update_layout(paper_bgcolor="rgba(0,0,0,0)", font_color="white")
+st.plotly_chart(fig_corr, use_container_width=True)
 
-st.success("CGPA above **8.0** significantly increases placement chances.")
-st.info("Internships and projects strongly correlate with placement success.")
-st.warning("Backlogs negatively affect placement probability.")
+st.divider()
+
+# ---------------------------------------------------
+# INPUT DRIFT (LOGGED REQUESTS vs TRAINING DATA)
+# ---------------------------------------------------
+drift_section(load_drift(tenant), "placement")
+
+st.divider()
 
 # ---------------------------------------------------
 # DATA DOWNLOAD & VIEW
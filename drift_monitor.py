@@ -0,0 +1,261 @@
+import argparse
+import json
+import math
+import os
+import threading
+import time
+
+import numpy as np
+
+from cohort_analytics import BASE_DIR, PREDICTION_LOG, feature_bins, read_tail_rows
+from feature_schema import PERFORMANCE_SCHEMA, PLACEMENT_SCHEMA
+from model_bundle import SchemaMismatchError
+
+# --------------------------------------------------
+# INPUT DRIFT MONITOR (PSI / KS ON FIXED BINS)
+#   reference: per-feature histogram of every schema-valid row of the
+#              training dataset (train and test split alike), written next
+#              to the model by the training scripts (or python drift_monitor.py)
+#   live:      the same histograms over a sliding window of requests,
+#              updated in O(features) per request from a ring buffer
+# --------------------------------------------------
+REFERENCE_FORMAT = 1
+REFERENCE_PATHS = {
+    "placement": os.path.join(BASE_DIR, "models", "placement_model.reference.json"),
+    "performance": os.path.join(BASE_DIR, "model.reference.json"),
+}
+
+PSI_MODERATE = 0.1
+PSI_MAJOR = 0.25
+KS_ALPHA_COEFFICIENT = 1.36  # two-sample KS critical value at alpha = 0.05
+MIN_SAMPLES = 50
+MAX_LOOKBACK = 100  # monitor_from_log reads at most this many windows of the log
+
+
+def histogram_bins(schema):
+    """(low, width, n_bins) per feature; same bins as cohort_analytics."""
+    bins = [feature_bins(f) for f in schema.features]
+    low = np.array([edges[0] for edges, _ in bins], dtype=np.float64)
+    width = np.array([w for _, w in bins], dtype=np.float64)
+    n_bins = np.array([len(edges) for edges, _ in bins], dtype=np.int64)
+    return low, width, n_bins
+
+
+def bin_indices(X, low, width, n_bins):
+    return np.clip(((X - low) / width + 1e-9).astype(np.int64), 0, n_bins - 1)
+
+
+# --------------------------------------------------
+# REFERENCE (TRAINING) HISTOGRAMS
+# --------------------------------------------------
+def reference_counts(X, schema):
+    low, width, n_bins = histogram_bins(schema)
+    index = bin_indices(np.asarray(X, dtype=np.float64), low, width, n_bins)
+    counts = np.zeros((len(schema), n_bins.max()), dtype=np.int64)
+    for i in range(len(schema)):
+        counts[i] = np.bincount(index[:, i], minlength=counts.shape[1])
+    return counts
+
+
+def save_reference(X, schema, path):
+    low, width, n_bins = histogram_bins(schema)
+    counts = reference_counts(X, schema)
+    reference = {
+        "format": REFERENCE_FORMAT,
+        "schema": schema.name,
+        "rows": int(len(X)),
+        "features": {
+            f.name: {"low": low[i], "width": width[i], "counts": counts[i, :n_bins[i]].tolist()}
+            for i, f in enumerate(schema.features)
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(reference, f)
+
+
+def load_reference(path, schema):
+    with open(path, encoding="utf-8") as f:
+        reference = json.load(f)
+
+    if reference.get("format") != REFERENCE_FORMAT:
+        raise SchemaMismatchError(f"{path}: unsupported reference format {reference.get('format')}")
+    if list(reference["features"]) != schema.names:
+        raise SchemaMismatchError(f"{path}: features do not match {schema.name} schema")
+
+    low, width, n_bins = histogram_bins(schema)
+    counts = np.zeros((len(schema), n_bins.max()), dtype=np.int64)
+    for i, name in enumerate(schema.names):
+        feature = reference["features"][name]
+        if (feature["low"], feature["width"], len(feature["counts"])) != (low[i], width[i], n_bins[i]):
+            raise SchemaMismatchError(f"{path}: {name} bins do not match {schema.name} schema")
+        counts[i, :n_bins[i]] = feature["counts"]
+    return counts
+
+
+# --------------------------------------------------
+# STATISTICS
+# --------------------------------------------------
+def psi(expected, actual, floor=1e-4):
+    """Population stability index; empty bins are floored at ``floor``."""
+    e = np.maximum(expected / expected.sum(), floor)
+    a = np.maximum(actual / actual.sum(), floor)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def binned_ks(expected, actual):
+    """Two-sample KS statistic on the binned CDFs (a lower bound on the exact one)."""
+    return float(np.abs(np.cumsum(expected) / expected.sum() - np.cumsum(actual) / actual.sum()).max())
+
+
+def drift_status(value):
+    if value >= PSI_MAJOR:
+        return "major"
+    if value >= PSI_MODERATE:
+        return "moderate"
+    return "stable"
+
+
+# --------------------------------------------------
+# LIVE WINDOW
+# --------------------------------------------------
+class DriftMonitor:
+    """Sliding window of the last ``window`` requests, compared with training."""
+
+    def __init__(self, schema, reference, window=1000, interval=10.0):
+        self.schema = schema
+        self.reference = reference
+        self.window = window
+        self.interval = interval
+        self.low, self.width, self.n_bins = histogram_bins(schema)
+        self.seen = 0
+        # plain Python on the request path: for a handful of features this
+        # is several times faster than numpy's per-call overhead
+        self._bins = list(zip(self.low.tolist(), self.width.tolist(), (self.n_bins - 1).tolist()))
+        self._slots = [None] * window
+        self._counts = [[0] * int(n) for n in self.n_bins]
+        self._next = 0
+        self._lock = threading.Lock()
+        self._stats = None
+        self._stats_at = 0.0
+
+    def record(self, features):
+        index = [
+            min(max(int((value - low) / width + 1e-9), 0), last)
+            for value, (low, width, last) in zip(features, self._bins)
+        ]
+        counts = self._counts
+        with self._lock:
+            slot = self._next
+            oldest = self._slots[slot]
+            if oldest is not None:
+                # the oldest request leaves the window
+                for feature, j in enumerate(oldest):
+                    counts[feature][j] -= 1
+            for feature, j in enumerate(index):
+                counts[feature][j] += 1
+            self._slots[slot] = index
+            self._next = (slot + 1) % self.window
+            self.seen += 1
+
+    def stats(self, max_age=None):
+        """PSI / KS per feature, recomputed at most every ``interval`` seconds."""
+        max_age = self.interval if max_age is None else max_age
+        now = time.monotonic()
+        if self._stats is not None and now - self._stats_at < max_age:
+            return self._stats
+
+        with self._lock:
+            live = np.zeros_like(self.reference)
+            for i, counts in enumerate(self._counts):
+                live[i, :len(counts)] = counts
+            samples = min(self.seen, self.window)
+        reference_rows = int(self.reference[0].sum())
+
+        result = {
+            "schema": self.schema.name,
+            "window": self.window,
+            "samples": samples,
+            "seen": self.seen,
+            "reference_rows": reference_rows,
+            "status": "insufficient data",
+            "features": {},
+        }
+        if samples >= MIN_SAMPLES:
+            ks_critical = KS_ALPHA_COEFFICIENT * math.sqrt(
+                (samples + reference_rows) / (samples * reference_rows)
+            )
+            for i, feature in enumerate(self.schema.features):
+                expected = self.reference[i, :self.n_bins[i]]
+                actual = live[i, :self.n_bins[i]]
+                value = psi(expected, actual)
+                ks = binned_ks(expected, actual)
+                result["features"][feature.name] = {
+                    "label": feature.label or feature.name,
+                    "psi": round(value, 4),
+                    "ks": round(ks, 4),
+                    "ks_critical": round(ks_critical, 4),
+                    "ks_drift": ks > ks_critical,
+                    "status": drift_status(value),
+                    "bin_low": (self.low[i] + self.width[i] * np.arange(self.n_bins[i])).round(4).tolist(),
+                    "reference": (expected / expected.sum()).round(4).tolist(),
+                    "live": (actual / actual.sum()).round(4).tolist(),
+                }
+            worst = max(f["psi"] for f in result["features"].values())
+            result["status"] = drift_status(worst)
+
+        self._stats = result
+        self._stats_at = now
+        return result
+
+
+def load_monitor(name, path=None, window=1000, interval=10.0):
+    schema = PLACEMENT_SCHEMA if name == "placement" else PERFORMANCE_SCHEMA
+    reference = load_reference(path or REFERENCE_PATHS[name], schema)
+    return DriftMonitor(schema, reference, window=window, interval=interval)
+
+
+def monitor_from_log(name, log_path=PREDICTION_LOG, window=1000, path=None):
+    """Monitor over the last ``window`` logged requests (for the dashboards)."""
+    monitor = load_monitor(name, path, window=window, interval=0.0)
+    schema = monitor.schema
+    # only the end of the log: rows for the other model (or invalid ones)
+    # are skipped, so widen the tail until it holds a full window, looking
+    # back at most MAX_LOOKBACK windows
+    n_rows = window
+    while True:
+        rows = read_tail_rows(log_path, n_rows)
+        if not all(field in rows.columns for field in schema.names):
+            return monitor
+        X = schema.frame_to_array(rows)
+        valid, _ = schema.validate_batch(X)
+        if valid.sum() >= window or len(rows) < n_rows or n_rows >= MAX_LOOKBACK * window:
+            break
+        n_rows = min(n_rows * 4, MAX_LOOKBACK * window)
+    for features in X[valid][-window:].tolist():
+        monitor.record(features)
+    return monitor
+
+
+# --------------------------------------------------
+# CLI: REBUILD REFERENCES FROM THE TRAINING DATASETS
+# --------------------------------------------------
+if __name__ == "__main__":
+    import pandas as pd
+
+    from tenants import DEFAULT_TENANT, tenant_path
+
+    parser = argparse.ArgumentParser(description="Write training reference histograms for drift monitoring.")
+    parser.add_argument("--tenant", default=DEFAULT_TENANT, help="college under tenants/ (default: repo root)")
+    parser.add_argument("--placement-data", default="dataset/placement_data.csv")
+    parser.add_argument("--performance-data", default="dataset/student_data.csv")
+    args = parser.parse_args()
+
+    for name, schema, data_path in (
+        ("placement", PLACEMENT_SCHEMA, args.placement_data),
+        ("performance", PERFORMANCE_SCHEMA, args.performance_data),
+    ):
+        X = schema.frame_to_array(pd.read_csv(tenant_path(args.tenant, os.path.abspath(data_path))))
+        valid, _ = schema.validate_batch(X)
+        reference_path = tenant_path(args.tenant, REFERENCE_PATHS[name])
+        save_reference(X[valid], schema, reference_path)
+        print(f"✅ {os.path.relpath(reference_path)} ({valid.sum()} rows)")
@@ -0,0 +1,142 @@
+import math
+import re
+from typing import NamedTuple
+
+import numpy as np
+
+# --------------------------------------------------
+# FEATURE DEFINITIONS
+# --------------------------------------------------
+_NUMBER = re.compile(r"\s*[+-]?(\d+\.?\d*|\.\d+)\s*")
+
+
+class Feature(NamedTuple):
+    name: str           # form / API field name
+    dtype: str          # "int" or "float"
+    low: float
+    high: float
+    step: float = 1
+    column: str = None  # training CSV column, if it differs from name
+    label: str = None
+
+    @property
+    def source_column(self):
+        return self.column or self.name
+
+
+class FeatureSchema:
+    """Ordered model inputs with types and ranges, shared by every entry point."""
+
+    def __init__(self, name, features):
+        self.name = name
+        self.features = tuple(features)
+        self.names = [f.name for f in self.features]
+        self.columns = [f.source_column for f in self.features]
+        self.low = np.array([f.low for f in self.features], dtype=float)
+        self.high = np.array([f.high for f in self.features], dtype=float)
+        self.integer = np.array([f.dtype == "int" for f in self.features])
+
+    def __len__(self):
+        return len(self.features)
+
+    def __getitem__(self, name):
+        return self.features[self.names.index(name)]
+
+    # --------------------------------------------------
+    # SINGLE ROW (FORMS / JSON)
+    # --------------------------------------------------
+    def parse(self, values):
+        """
+        Parse one mapping of field -> raw value (form or JSON). Returns
+        (row, errors); row is None when any field is invalid. Malformed input
+        is rejected by pattern match rather than by raising.
+        """
+        row, errors = [], {}
+        for feature in self.features:
+            raw = values.get(feature.name)
+            if raw is None or raw == "":
+                errors[feature.name] = f"{feature.label or feature.name} is required"
+                continue
+            if isinstance(raw, bool) or not (
+                isinstance(raw, (int, float)) or (isinstance(raw, str) and _NUMBER.fullmatch(raw))
+            ):
+                errors[feature.name] = f"{feature.label or feature.name} must be a number"
+                continue
+
+            out_of_range = (
+                f"{feature.label or feature.name} must be between "
+                f"{feature.low:g} and {feature.high:g}"
+            )
+            try:
+                value = float(raw)
+            except OverflowError:
+                # a JSON integer too large for a float (e.g. 10**400)
+                errors[feature.name] = out_of_range
+                continue
+            if not math.isfinite(value):
+                errors[feature.name] = f"{feature.label or feature.name} must be a number"
+                continue
+            if feature.dtype == "int":
+                if value != int(value):
+                    errors[feature.name] = f"{feature.label or feature.name} must be a whole number"
+                    continue
+                value = int(value)
+            if not feature.low <= value <= feature.high:
+                errors[feature.name] = out_of_range
+                continue
+            row.append(value)
+
+        return (None if errors else tuple(row)), errors
+
+    # --------------------------------------------------
+    # BATCH (VECTORISED)
+    # --------------------------------------------------
+    def validate_batch(self, X):
+        """
+        Validate an (n_rows, n_features) array in schema order; unparsable
+        cells should already be NaN. Returns (valid_rows, errors) where
+        errors maps feature name -> number of bad rows.
+        """
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != len(self):
+            raise ValueError(f"{self.name}: expected {len(self)} columns, got shape {X.shape}")
+
+        bad = ~np.isfinite(X)
+        with np.errstate(invalid="ignore"):
+            bad |= (X < self.low) | (X > self.high)
+            bad |= self.integer & (X != np.floor(X))
+
+        counts = bad.sum(axis=0)
+        errors = {name: int(n) for name, n in zip(self.names, counts) if n}
+        return ~bad.any(axis=1), errors
+
+    def frame_to_array(self, df, dtype=np.float64):
+        """Pull schema columns out of a DataFrame (by name or training column)."""
+        import pandas as pd
+
+        columns = []
+        for feature in self.features:
+            key = feature.name if feature.name in df.columns else feature.source_column
+            columns.append(pd.to_numeric(df[key], errors="coerce").to_numpy(dtype=dtype))
+        return np.column_stack(columns) if columns else np.empty((len(df), 0), dtype=dtype)
+
+
+# --------------------------------------------------
+# MODEL SCHEMAS
+# --------------------------------------------------
+PERFORMANCE_SCHEMA = FeatureSchema("performance", [
+    Feature("attendance", "int", 0, 100, label="Attendance"),
+    Feature("study_hours", "int", 0, 24, label="Study hours"),
+    Feature("internal_marks", "int", 0, 100, label="Internal marks"),
+    Feature("assignment_score", "int", 0, 100, label="Assignment score"),
+])
+
+PLACEMENT_SCHEMA = FeatureSchema("placement", [
+    Feature("cgpa", "float", 0.0, 10.0, step=0.1, label="CGPA"),
+    Feature("internships", "int", 0, 10, label="Internships"),
+    Feature("projects", "int", 0, 10, label="Projects"),
+    Feature("aptitude", "int", 0, 100, column="aptitude_score", label="Aptitude score"),
+    Feature("skills", "int", 1, 5, label="Technical skills"),
+    Feature("communication", "int", 1, 5, label="Communication skills"),
+    Feature("backlogs", "int", 0, 10, label="Backlogs"),
+])
@@ -0,0 +1,106 @@
+import gc
+import multiprocessing
+import os
+
+# --------------------------------------------------
+# GUNICORN PRODUCTION CONFIG
+#   gunicorn -c gunicorn.conf.py wsgi:app
+#   (or: python wsgi.py)
+# --------------------------------------------------
+CPU_COUNT = multiprocessing.cpu_count()
+
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+# --------------------------------------------------
+# BIND / PRELOAD
+# --------------------------------------------------
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# load app.py once in the master so workers share those pages
+# copy-on-write after fork; the models are loaded in when_ready below
+preload_app = True
+
+# --------------------------------------------------
+# WORKER CLASS / COUNT
+#   sync    - one request per worker, CPU-bound prediction traffic
+#   gthread - threads per worker, good default for mixed chat + predict
+#   gevent  - many idle chat connections (needs `pip install gevent`)
+# --------------------------------------------------
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+
+if worker_class == "sync":
+    workers = env_int("GUNICORN_WORKERS", CPU_COUNT * 2 + 1)
+    threads = 1
+elif worker_class == "gevent":
+    workers = env_int("GUNICORN_WORKERS", CPU_COUNT + 1)
+    threads = 1
+    worker_connections = env_int("GUNICORN_WORKER_CONNECTIONS", 1000)
+else:
+    workers = env_int("GUNICORN_WORKERS", CPU_COUNT + 1)
+    threads = env_int("GUNICORN_THREADS", 4)
+
+# --------------------------------------------------
+# TIMEOUTS
+# --------------------------------------------------
+timeout = env_int("GUNICORN_TIMEOUT", 30)
+graceful_timeout = env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = env_int("GUNICORN_KEEPALIVE", 5)
+
+# --------------------------------------------------
+# GRACEFUL RECYCLING (REQUEST COUNT + MEMORY)
+# --------------------------------------------------
+max_requests = env_int("GUNICORN_MAX_REQUESTS", 2000)
+max_requests_jitter = env_int("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10)
+
+# restart a worker once its resident memory passes this many MB (0 = off)
+max_worker_rss_mb = env_int("GUNICORN_MAX_WORKER_RSS_MB", 512)
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+
+
+def worker_rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        return 0.0
+
+
+# --------------------------------------------------
+# SERVER HOOKS
+# --------------------------------------------------
+def when_ready(server):
+    # app.py loads each tenant's models (and neighbour indexes) lazily;
+    # load the TENANT_PRELOAD tenants here, before forking, so every worker
+    # starts with them and schema mismatches fail at boot. They are pinned:
+    # evicting pages shared with the master would free nothing.
+    from app import PRELOAD_TENANTS, similar_index, tenant_registry
+
+    for tenant in PRELOAD_TENANTS:
+        tenant_registry.pin(tenant)
+        similar_index("placement", tenant)
+        similar_index("performance", tenant)
+
+    # move preloaded objects out of the GC's generations so collections in
+    # workers don't touch (and un-share) the parent's pages
+    gc.collect()
+    gc.freeze()
+    server.log.info(
+        "preloaded app: %s workers, %s threads, worker_class=%s",
+        workers, threads, worker_class
+    )
+
+
+def post_request(worker, req, environ, resp):
+    if not max_worker_rss_mb:
+        return
+    rss = worker_rss_mb()
+    if rss > max_worker_rss_mb:
+        worker.log.info("worker %s at %.0f MB RSS, recycling", worker.pid, rss)
+        worker.alive = False
@@ -0,0 +1,124 @@
+import hashlib
+import pickle
+
+import numpy as np
+
+from calibration import Calibrator
+
+# --------------------------------------------------
+# MODEL BUNDLE FORMAT
+#   {"format", "schema", "features", "dtypes", "sha256", "estimator_pickle",
+#    "calibration" (optional)}
+# --------------------------------------------------
+BUNDLE_FORMAT = 1
+
+
+class SchemaMismatchError(ValueError):
+    pass
+
+
+class ModelBundle:
+    """
+    A fitted estimator plus the ordered feature schema it was trained on.
+    Inputs are fed as contiguous float32 arrays in schema order.
+    """
+
+    def __init__(self, estimator, schema_name, features, dtypes, sha256, path=None, calibration=None):
+        self.estimator = estimator
+        self.calibration = calibration
+        self.calibrate = Calibrator(calibration)
+        self.schema_name = schema_name
+        self.features = list(features)
+        self.dtypes = list(dtypes)
+        self.sha256 = sha256
+        self.path = path
+
+    @property
+    def version(self):
+        return self.sha256[:12]
+
+    @property
+    def classes_(self):
+        return self.estimator.classes_
+
+    def _as_input(self, X):
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != len(self.features):
+            raise SchemaMismatchError(
+                f"{self.schema_name}: expected {len(self.features)} features, got {X.shape[1]}"
+            )
+        return X
+
+    def predict(self, X):
+        return self.estimator.predict(self._as_input(X))
+
+    def predict_proba(self, X):
+        return self.estimator.predict_proba(self._as_input(X))
+
+    def calibrated_proba(self, X):
+        """Positive-class probability after the bundled calibration table."""
+        return self.calibrate(self.predict_proba(X)[:, 1])
+
+
+# --------------------------------------------------
+# SAVE
+# --------------------------------------------------
+def save_bundle(estimator, schema, path, calibration=None):
+    estimator_pickle = pickle.dumps(estimator, protocol=pickle.HIGHEST_PROTOCOL)
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "schema": schema.name,
+        "features": list(schema.columns),
+        "dtypes": [f.dtype for f in schema.features],
+        "sha256": hashlib.sha256(estimator_pickle).hexdigest(),
+        "estimator_pickle": estimator_pickle,
+        "calibration": calibration,
+    }
+    with open(path, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return bundle["sha256"]
+
+
+# --------------------------------------------------
+# LOAD (VALIDATED AGAINST THE SERVING SCHEMA)
+# --------------------------------------------------
+def load_bundle(path, schema):
+    with open(path, "rb") as f:
+        raw = f.read()
+    payload = pickle.loads(raw)
+
+    if isinstance(payload, dict) and "estimator_pickle" in payload:
+        if payload.get("format") != BUNDLE_FORMAT:
+            raise SchemaMismatchError(f"{path}: unsupported bundle format {payload.get('format')}")
+        digest = hashlib.sha256(payload["estimator_pickle"]).hexdigest()
+        if digest != payload["sha256"]:
+            raise SchemaMismatchError(f"{path}: content hash mismatch")
+        estimator = pickle.loads(payload["estimator_pickle"])
+        features, dtypes = payload["features"], payload["dtypes"]
+        calibration = payload.get("calibration")
+    else:
+        # legacy artifact: a bare pickled estimator fitted on a named frame
+        estimator = payload
+        digest = hashlib.sha256(raw).hexdigest()
+        names = getattr(estimator, "feature_names_in_", None)
+        features = list(names) if names is not None else list(schema.columns)
+        dtypes = [f.dtype for f in schema.features]
+        calibration = None
+
+    expected = list(schema.columns)
+    if features != expected:
+        raise SchemaMismatchError(
+            f"{path}: model features {features} do not match {schema.name} schema {expected}"
+        )
+    if dtypes != [f.dtype for f in schema.features]:
+        raise SchemaMismatchError(f"{path}: feature dtypes {dtypes} do not match {schema.name} schema")
+    if getattr(estimator, "n_features_in_", len(expected)) != len(expected):
+        raise SchemaMismatchError(f"{path}: estimator expects {estimator.n_features_in_} features")
+
+    # order is verified above; drop the names so arrays are accepted as-is
+    if hasattr(estimator, "feature_names_in_"):
+        del estimator.feature_names_in_
+
+    return ModelBundle(estimator, schema.name, features, dtypes, digest, path, calibration)
@@ -0,0 +1,66 @@
+import gzip
+import hashlib
+import threading
+
+from flask import make_response, render_template, request
+
+# --------------------------------------------------
+# PRE-RENDERED STATIC PAGES (ETAG + GZIP)
+# --------------------------------------------------
+CACHE_CONTROL = "public, no-cache"
+
+
+class StaticPageCache:
+    """
+    Renders variable-free templates once per process and serves the bytes
+    with strong ETags, answering If-None-Match with 304.
+    """
+
+    def __init__(self, compress=True):
+        self.compress = compress
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def _render(self, template):
+        body = render_template(template).encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:20]
+        page = {"identity": (body, digest)}
+        if self.compress:
+            page["gzip"] = (gzip.compress(body, compresslevel=9, mtime=0), digest + "-gz")
+        return page
+
+    def page(self, template):
+        page = self._pages.get(template)
+        if page is None:
+            with self._lock:
+                page = self._pages.get(template)
+                if page is None:
+                    page = self._pages[template] = self._render(template)
+        return page
+
+    def warm(self, app, templates):
+        with app.test_request_context():
+            for template in templates:
+                self.page(template)
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+
+    def serve(self, template):
+        page = self.page(template)
+        encoding = "gzip" if "gzip" in page and request.accept_encodings["gzip"] > 0 else "identity"
+        body, etag = page[encoding]
+
+        if request.if_none_match.contains(etag):
+            response = make_response("", 304)
+        else:
+            response = make_response(body)
+            response.content_type = "text/html; charset=utf-8"
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = CACHE_CONTROL
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
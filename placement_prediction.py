@@ -1,6 +1,7 @@
 import streamlit as st
-import pickle
-import numpy as np
+
+from feature_schema import PLACEMENT_SCHEMA
+from scorer import load_portable
 
 # Page config
 st.set_page_config(
@@ -12,24 +13,42 @@ st.set_page_config(
 st.title("🎯 Placement Prediction System")
 st.markdown("Predict whether a student is likely to get placed based on academic and skill factors.")
 
-# Load trained model
-with open("models/placement_model.pkl", "rb") as f:
-    model = pickle.load(f)
+# Load the portable scorer once per server process (not on every rerun);
+# falls back to the pickle if the scorer wasn't re-exported after a retrain
+@st.cache_resource
+def load_model():
+    return load_portable(
+        "models/placement_model.scorer.npz", PLACEMENT_SCHEMA, "models/placement_model.pkl"
+    )
+
+
+model = load_model()
 
 # ---- INPUT SECTION ----
 st.subheader("📌 Enter Student Details")
 
-cgpa = st.number_input("CGPA (0–10)", min_value=0.0, max_value=10.0, value=7.0)
-internships = st.number_input("Number of Internships", min_value=0, max_value=10, value=1)
-projects = st.number_input("Number of Projects", min_value=0, max_value=10, value=2)
-aptitude = st.slider("Aptitude Score (0–100)", 0, 100, 70)
-technical_skills = st.slider("Technical Skills (1–5)", 1, 5, 3)
-communication_skills = st.slider("Communication Skills (1–5)", 1, 5, 3)
-backlogs = st.number_input("Number of Backlogs", min_value=0, max_value=10, value=0)
+def schema_input(name, widget, value):
+    feature = PLACEMENT_SCHEMA[name]
+    cast = float if feature.dtype == "float" else int
+    return widget(
+        f"{feature.label} ({feature.low:g}–{feature.high:g})",
+        min_value=cast(feature.low),
+        max_value=cast(feature.high),
+        value=cast(value)
+    )
+
+
+cgpa = schema_input("cgpa", st.number_input, 7.0)
+internships = schema_input("internships", st.number_input, 1)
+projects = schema_input("projects", st.number_input, 2)
+aptitude = schema_input("aptitude", st.slider, 70)
+technical_skills = schema_input("skills", st.slider, 3)
+communication_skills = schema_input("communication", st.slider, 3)
+backlogs = schema_input("backlogs", st.number_input, 0)
 
 # ---- PREDICTION ----
 if st.button("🔮 Predict Placement"):
-    input_data = np.array([
+    input_data = [
         cgpa,
         internships,
         projects,
@@ -37,12 +56,11 @@ if st.button("🔮 Predict Placement"):
         technical_skills,
         communication_skills,
         backlogs
-    ]).reshape(1, -1)
+    ]
 
-    prediction = model.predict(input_data)[0]
-    probability = model.predict_proba(input_data)[0][1] * 100
+    probability = model.calibrated_proba(input_data)[0] * 100
 
-    if prediction == 1:
+    if probability >= 50:
         st.success(f"✅ Student is likely to be PLACED ({probability:.2f}%)")
     else:
         st.error(f"❌ Student is NOT likely to be placed ({probability:.2f}%)")
@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from feature_schema import PLACEMENT_SCHEMA
+
+
+# --------------------------------------------------
+# LRU / TTL PREDICTION CACHE
+# --------------------------------------------------
+class PredictionCache:
+    """Bounded LRU memo cache with optional TTL and hit/miss counters."""
+
+    def __init__(self, maxsize=4096, ttl=None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if self.ttl is None or time.monotonic() - stored_at < self.ttl:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# --------------------------------------------------
+# PLACEMENT LOOKUP TABLE (FEASIBLE INPUT SPACE)
+# --------------------------------------------------
+# (low, high, step) per placement feature, in model column order
+PLACEMENT_DOMAINS = tuple((f.low, f.high, f.step) for f in PLACEMENT_SCHEMA.features)
+
+
+class PlacementLookupTable:
+    """
+    Precomputed scores for every feasible placement input.
+
+    The full cross product of PLACEMENT_DOMAINS is ~3.4e8 cells, so instead
+    of a dense table we store one contribution array per feature. For a
+    linear model the decision value is the sum of those contributions plus
+    the intercept, so scoring is seven array lookups and a sigmoid and
+    matches ``predict_proba`` exactly.
+    """
+
+    def __init__(self, model, domains=PLACEMENT_DOMAINS):
+        coef = getattr(model, "coef_", None)
+        if coef is None or coef.shape[0] != 1 or len(domains) != coef.shape[1]:
+            raise ValueError("lookup table needs a binary linear model")
+
+        self.domains = domains
+        self.intercept = float(model.intercept_[0])
+        self.tables = []
+        for weight, (low, high, step) in zip(coef[0], domains):
+            n_values = int(round((high - low) / step)) + 1
+            grid = low + step * np.arange(n_values)
+            self.tables.append(weight * grid)
+
+    def _indices(self, features):
+        indices = []
+        for value, (low, high, step) in zip(features, self.domains):
+            if not low <= value <= high:
+                return None
+            position = (value - low) / step
+            index = int(round(position))
+            if abs(position - index) > 1e-6:
+                return None
+            indices.append(index)
+        return indices
+
+    def lookup(self, features):
+        """Return (prediction, probability) or None if off the grid."""
+        indices = self._indices(features)
+        if indices is None:
+            return None
+
+        decision = self.intercept
+        for table, index in zip(self.tables, indices):
+            decision += table[index]
+
+        prob = 1.0 / (1.0 + np.exp(-decision))
+        return int(decision > 0), float(prob)
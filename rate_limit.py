@@ -0,0 +1,206 @@
+import os
+import sqlite3
+import threading
+import time
+
+from flask import g, jsonify, request
+
+# --------------------------------------------------
+# TOKEN BUCKET BACKENDS
+#   take(key, rate, burst) -> (allowed, retry_after_seconds)
+# --------------------------------------------------
+class MemoryBackend:
+    """Per-process buckets; each gunicorn worker limits independently."""
+
+    def __init__(self, max_keys=100_000):
+        self.max_keys = max_keys
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst):
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            if len(self._buckets) >= self.max_keys and key not in self._buckets:
+                self._buckets.clear()
+            self._buckets[key] = (tokens, now)
+        return allowed, 0.0 if allowed else (1 - tokens) / rate
+
+
+class SQLiteBackend:
+    """Buckets in a shared SQLite file so all workers on a host agree."""
+
+    def __init__(self, path):
+        # nothing is opened here: with gunicorn's preload_app this runs in
+        # the master, and SQLite handles must not cross fork()
+        self.path = path
+        self._local = threading.local()
+
+    def _connect(self):
+        # one connection per thread, opened in the process that uses it
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def take(self, key, rate, burst):
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+            tokens, updated = row if row else (burst, now)
+            tokens = min(burst, tokens + max(0.0, now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens, now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return allowed, 0.0 if allowed else (1 - tokens) / rate
+
+
+# --------------------------------------------------
+# LOAD SHEDDING (QUEUE DEPTH + LATENCY)
+# --------------------------------------------------
+class LoadShedder:
+    """
+    Rejects work early when too many inference requests are in flight, the
+    request already waited longer than the latency budget in a queue in
+    front of the app, or the recent (EWMA) latency including that wait is
+    over budget. While over the latency budget, one request at a time is
+    still let through to refresh the estimate.
+    """
+
+    def __init__(self, max_in_flight=16, latency_threshold=0.5, alpha=0.2):
+        self.max_in_flight = max_in_flight
+        self.latency_threshold = latency_threshold
+        self.alpha = alpha
+        self.in_flight = 0
+        self.latency = 0.0
+        self.shed = 0
+        self._lock = threading.Lock()
+
+    def try_enter(self, queued=0.0):
+        with self._lock:
+            overloaded = (
+                self.in_flight >= self.max_in_flight
+                or queued > self.latency_threshold
+                or (self.latency > self.latency_threshold and self.in_flight > 0)
+            )
+            if overloaded:
+                self.shed += 1
+                return False
+            self.in_flight += 1
+            return True
+
+    def exit(self, elapsed):
+        # elapsed: queue wait + time in the app
+        with self._lock:
+            self.in_flight -= 1
+            self.latency += self.alpha * (elapsed - self.latency)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "latency_ewma_ms": round(self.latency * 1000, 2),
+                "latency_threshold_ms": round(self.latency_threshold * 1000, 2),
+                "shed": self.shed
+            }
+
+
+# --------------------------------------------------
+# FLASK INTEGRATION
+# --------------------------------------------------
+def client_id(trust_proxy=False):
+    if trust_proxy:
+        # the rightmost hop is the one our proxy appended; anything to its
+        # left comes from the client and could be rotated to dodge limits
+        forwarded = request.headers.get("X-Forwarded-For", "")
+        hop = forwarded.rsplit(",", 1)[-1].strip()
+        if hop:
+            return hop
+    return request.remote_addr or "unknown"
+
+
+def queue_seconds():
+    """
+    Time the request waited before reaching the app, from the proxy's
+    X-Request-Start header ("t=<epoch>" in s, ms or us, as nginx / Heroku
+    send it). Requests queued inside gunicorn are invisible to Flask, so
+    this is the only overload signal that sees them.
+    """
+    header = request.headers.get("X-Request-Start", "")
+    try:
+        start = float(header.strip().removeprefix("t="))
+    except ValueError:
+        return 0.0
+    if start > 1e14:
+        start /= 1e6
+    elif start > 1e11:
+        start /= 1e3
+    return max(0.0, time.time() - start)
+
+
+def init_rate_limiting(app, backend, limits, shedder=None, shed_endpoints=(), trust_proxy=False):
+    """
+    ``limits`` maps endpoint name -> (requests per second, burst). Endpoints
+    in ``shed_endpoints`` are also guarded by ``shedder``.
+    """
+    app.extensions["rate_limit"] = {"limits": limits, "shedder": shedder, "rejected": 0}
+    state = app.extensions["rate_limit"]
+
+    @app.before_request
+    def _rate_limit():
+        endpoint = request.endpoint
+        limit = limits.get(endpoint)
+        if limit is not None:
+            rate, burst = limit
+            allowed, retry_after = backend.take(f"{endpoint}:{client_id(trust_proxy)}", rate, burst)
+            if not allowed:
+                state["rejected"] += 1
+                response = jsonify({"error": "rate limit exceeded"})
+                response.status_code = 429
+                response.headers["Retry-After"] = str(max(1, round(retry_after)))
+                return response
+
+        if shedder is not None and endpoint in shed_endpoints:
+            # the header is client-settable unless a proxy sets it
+            queued = queue_seconds() if trust_proxy else 0.0
+            if not shedder.try_enter(queued):
+                response = jsonify({"error": "server busy, please retry"})
+                response.status_code = 503
+                response.headers["Retry-After"] = "1"
+                return response
+            g.shed_started = time.perf_counter() - queued
+
+    @app.teardown_request
+    def _release(exc):
+        started = g.pop("shed_started", None)
+        if started is not None:
+            shedder.exit(time.perf_counter() - started)
+
+
+def backend_from_env():
+    if os.environ.get("RATE_LIMIT_BACKEND", "memory") == "sqlite":
+        return SQLiteBackend(os.environ.get("RATE_LIMIT_DB", "/tmp/path2placement_ratelimit.db"))
+    return MemoryBackend()
@@ -0,0 +1,145 @@
+import argparse
+import logging
+import os
+
+import numpy as np
+
+from calibration import Calibrator
+from compact_forest import file_sha256, load_compact
+from model_bundle import SchemaMismatchError, load_bundle
+
+# --------------------------------------------------
+# PORTABLE SCORERS (NUMPY ONLY, NO SKLEARN AT RUNTIME)
+#   linear  -> models/placement_model.scorer.npz  (python scorer.py)
+#   forest  -> model.compact.npz                  (python compact_forest.py)
+# --------------------------------------------------
+SCORER_FORMAT = 1
+
+
+class LinearScorer:
+    """Binary logistic-regression scorer from exported coefficients."""
+
+    def __init__(self, arrays):
+        self.coef = arrays["coef"]
+        self.intercept = float(arrays["intercept"])
+        self.classes_ = arrays["classes"]
+        self.features = [str(f) for f in arrays["features"]]
+        self.version = str(arrays["source_version"])
+        self.schema_name = str(arrays["schema"])
+        table = None
+        if arrays["calibration_x"].size:
+            table = {
+                "method": str(arrays["calibration_method"]),
+                "x": arrays["calibration_x"],
+                "y": arrays["calibration_y"],
+            }
+        self.calibrate = Calibrator(table)
+
+    # sklearn-style attributes, so PlacementLookupTable accepts a scorer
+    @property
+    def coef_(self):
+        return self.coef.reshape(1, -1)
+
+    @property
+    def intercept_(self):
+        return np.array([self.intercept])
+
+    def _as_input(self, X):
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != len(self.features):
+            raise SchemaMismatchError(
+                f"{self.schema_name}: expected {len(self.features)} features, got {X.shape[1]}"
+            )
+        return X
+
+    def decision_function(self, X):
+        return self._as_input(X) @ self.coef + self.intercept
+
+    def predict_proba(self, X):
+        positive = 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+        return np.column_stack([1.0 - positive, positive])
+
+    def calibrated_proba(self, X):
+        return self.calibrate(self.predict_proba(X)[:, 1])
+
+    def predict(self, X):
+        return self.classes_.take((self.decision_function(X) > 0).astype(int))
+
+
+# --------------------------------------------------
+# EXPORT (TRAINING SIDE)
+# --------------------------------------------------
+def export_linear_scorer(bundle, path):
+    estimator = bundle.estimator
+    if getattr(estimator, "coef_", None) is None or estimator.coef_.shape[0] != 1:
+        raise ValueError("portable linear scorer needs a binary linear model")
+
+    calibration = bundle.calibration or {"method": "identity", "x": [], "y": []}
+    with open(path, "wb") as f:
+        np.savez(
+            f,
+            format=np.int64(SCORER_FORMAT),
+            kind=np.str_("linear"),
+            schema=np.str_(bundle.schema_name),
+            features=np.array(bundle.features),
+            source_version=np.str_(bundle.version),
+            source_sha256=np.str_(file_sha256(bundle.path)),
+            coef=np.asarray(estimator.coef_[0], dtype=np.float64),
+            intercept=np.float64(estimator.intercept_[0]),
+            classes=estimator.classes_,
+            calibration_method=np.str_(calibration["method"]),
+            calibration_x=np.asarray(calibration["x"], dtype=np.float64),
+            calibration_y=np.asarray(calibration["y"], dtype=np.float64),
+        )
+
+
+# --------------------------------------------------
+# LOAD
+# --------------------------------------------------
+def load_scorer(path, schema, source_path=None):
+    """Load a portable scorer; raises SchemaMismatchError if it doesn't fit."""
+    with np.load(path, allow_pickle=False) as data:
+        if "coef" not in data.files:
+            return load_compact(path, schema, source_path)
+        arrays = {name: data[name] for name in data.files}
+
+    if int(arrays["format"]) != SCORER_FORMAT:
+        raise SchemaMismatchError(f"{path}: unsupported scorer format {arrays['format']}")
+    if [str(f) for f in arrays["features"]] != list(schema.columns):
+        raise SchemaMismatchError(f"{path}: features do not match {schema.name} schema")
+    if source_path is not None and str(arrays["source_sha256"]) != file_sha256(source_path):
+        raise SchemaMismatchError(f"{path}: built from a different {os.path.basename(source_path)}")
+
+    return LinearScorer(arrays)
+
+
+def load_portable(path, schema, source_path):
+    """
+    The numpy-only artifact at ``path`` when it was built from the current
+    ``source_path`` pickle, else the pickled bundle itself (imports sklearn).
+    """
+    if os.path.isfile(path):
+        try:
+            return load_scorer(path, schema, source_path)
+        except SchemaMismatchError as e:
+            logging.getLogger(__name__).warning("ignoring %s: %s", os.path.basename(path), e)
+    return load_bundle(source_path, schema)
+
+
+if __name__ == "__main__":
+    from feature_schema import PLACEMENT_SCHEMA
+
+    parser = argparse.ArgumentParser(description="Export the placement model as a portable scorer.")
+    parser.add_argument("model", nargs="?", default="models/placement_model.pkl")
+    parser.add_argument("output", nargs="?", default="models/placement_model.scorer.npz")
+    args = parser.parse_args()
+
+    bundle = load_bundle(args.model, PLACEMENT_SCHEMA)
+    export_linear_scorer(bundle, args.output)
+    scorer = load_scorer(args.output, PLACEMENT_SCHEMA, source_path=args.model)
+
+    X = np.array([[7.5, 1, 2, 70, 3, 3, 0], [6.0, 0, 1, 50, 2, 2, 3]], dtype=np.float32)
+    drift = np.abs(bundle.predict_proba(X) - scorer.predict_proba(X)).max()
+    print(f"✅ Wrote {args.output} (max |Δp| vs sklearn = {drift:.2e})")
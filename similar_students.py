@@ -0,0 +1,234 @@
+import threading
+import time
+
+import numpy as np
+
+from cohort_analytics import COHORTS, read_new_rows, rows_to_arrays
+
+# --------------------------------------------------
+# "STUDENTS LIKE YOU" (NEAREST NEIGHBOURS)
+#   KD-tree over z-scored feature vectors, plus a small brute-force
+#   buffer for rows appended since the last build. The tree is rebuilt in
+#   a background thread once the buffer passes REBUILD_FRACTION of the
+#   indexed rows; queries keep using the old tree + buffer until then.
+#   Only features, outcome and source are stored: the endpoints are
+#   public, so no names or timestamps are ever returned.
+# --------------------------------------------------
+SOURCE_NAMES = ("dataset", "prediction")
+
+# index name -> (outcome key, rate key, {cohort in cohort_analytics.COHORTS: source})
+INDEXES = {
+    "placement": ("placed", "placement_rate", {
+        "placement": "dataset", "placement_predictions": "prediction"
+    }),
+    "performance": ("passed", "pass_rate", {
+        "performance": "dataset", "performance_predictions": "prediction"
+    }),
+}
+
+LEAF_SIZE = 16
+MIN_BUFFER = 1024
+REBUILD_FRACTION = 0.05
+MAX_K = 50
+
+
+def _empty(n_features):
+    return np.empty((0, n_features)), np.empty(0, dtype=np.int8), np.empty(0, dtype=np.int8)
+
+
+class NeighbourIndex:
+    def __init__(self, schema, outcome="placed", rate_key="placement_rate", cohorts=COHORTS):
+        self.schema = schema
+        self.cohorts = cohorts  # cohort_analytics.COHORTS or a tenant's copy
+        self.outcome = outcome
+        self.rate_key = rate_key
+        self.sources = {}
+        self.refreshed = 0.0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._rebuilding = False
+        self._generation = 0  # bumped on reset; stale rebuilds are dropped
+        # (main, buffer, z-scored buffer X) where main is (tree, X, y, source,
+        # mean, std) or None and buffer is (X, y, source);
+        # swapped as one tuple so queries never see a half-updated index
+        self._view = (None, _empty(len(schema)), None)
+
+    def __len__(self):
+        main, buffer, _ = self._view
+        return (len(main[1]) if main else 0) + len(buffer[0])
+
+    def nbytes(self):
+        """Approximate memory held by the stored rows and the tree."""
+        main, buffer, buffer_z = self._view
+        arrays = list(buffer) + ([buffer_z] if buffer_z is not None else [])
+        if main is not None:
+            tree = main[0]
+            arrays += [tree.data, tree.indices] + list(main[1:])
+        return sum(a.nbytes for a in arrays)
+
+    # --------------------------------------------------
+    # BUILD / ADD
+    # --------------------------------------------------
+    def _batch(self, X, y, source):
+        X = np.asarray(X, dtype=np.float64).reshape(-1, len(self.schema))
+        return (
+            X,
+            np.asarray(y, dtype=np.int8),
+            np.full(len(X), SOURCE_NAMES.index(source), dtype=np.int8),
+        )
+
+    def add(self, X, y, source):
+        batch = self._batch(X, y, source)
+        if len(batch[0]):
+            self._append(batch)
+
+    def _append(self, batch):
+        with self._lock:
+            main, buffer, _ = self._view
+            buffer = tuple(np.concatenate(pair) for pair in zip(buffer, batch))
+            if main is None:
+                self._view = (self._build(*buffer), _empty(len(self.schema)), None)
+                return
+            mean, std = main[4], main[5]
+            self._view = (main, buffer, (buffer[0] - mean) / std)
+            if not self._rebuilding and len(buffer[0]) > max(MIN_BUFFER, REBUILD_FRACTION * len(main[1])):
+                self._rebuilding = True
+                threading.Thread(
+                    target=self._rebuild, args=(main, buffer, self._generation), daemon=True
+                ).start()
+
+    def _rebuild(self, main, buffer, generation):
+        # off the request thread: a tree over 1M rows takes seconds to build
+        try:
+            built = self._build(*(np.concatenate(pair) for pair in zip(main[1:4], buffer)))
+        except Exception:
+            with self._lock:
+                self._rebuilding = False
+            raise
+        # cleared together with the swap, so the next rebuild starts from it
+        with self._lock:
+            self._rebuilding = False
+            if generation != self._generation:
+                return  # the index was reset while building
+            # rows appended while building stay in the buffer
+            _, current, _ = self._view
+            rest = tuple(column[len(buffer[0]):] for column in current)
+            mean, std = built[4], built[5]
+            self._view = (built, rest, (rest[0] - mean) / std if len(rest[0]) else None)
+
+    def _reset(self):
+        with self._lock:
+            self._generation += 1
+            self._view = (None, _empty(len(self.schema)), None)
+
+    def _build(self, X, y, source):
+        from scipy.spatial import cKDTree
+
+        mean = X.mean(axis=0)
+        std = X.std(axis=0)
+        std[std == 0] = 1.0
+        tree = cKDTree((X - mean) / std, leafsize=LEAF_SIZE)
+        return tree, X, y, source, mean, std
+
+    # --------------------------------------------------
+    # SOURCES (DATASET + PREDICTION LOG)
+    # --------------------------------------------------
+    def refresh(self, sources, min_interval=0.0):
+        """Index rows appended to the source files; start over if one was replaced."""
+        if time.monotonic() - self.refreshed < min_interval:
+            return
+        if not self._refresh_lock.acquire(blocking=False):
+            return  # another thread is refreshing; keep serving the current view
+        try:
+            self.refreshed = time.monotonic()
+            batches = []
+            for name, source in sources.items():
+                path, schema, outcome, positive, negative, _ = self.cohorts[name]
+                rows, state, reset = read_new_rows(path, self.sources.get(name))
+                if reset:
+                    self.sources = {}
+                    batches = None
+                    break
+                self.sources[name] = state
+                X, y, _ = rows_to_arrays(rows, schema, outcome, positive, negative)
+                batches.append((X, y, source))
+        finally:
+            self._refresh_lock.release()
+
+        if batches is None:
+            self._reset()
+            return self.refresh(sources)
+
+        batches = [batch for batch in (self._batch(*args) for args in batches) if len(batch[0])]
+        if batches and self._view[0] is None:
+            # first build (or after a reset): one synchronous build over every
+            # source. A background rebuild started here would be lost when
+            # gunicorn forks the master that built the index, since threads
+            # don't survive fork().
+            batches = [tuple(np.concatenate(columns) for columns in zip(*batches))]
+        for batch in batches:
+            self._append(batch)
+
+    # --------------------------------------------------
+    # QUERY
+    # --------------------------------------------------
+    def query(self, features, k=5):
+        """(distances, (X, y, source)) of the k nearest stored rows."""
+        main, buffer, buffer_z = self._view
+        if main is None:
+            return np.empty(0), None
+        tree, X, y, source, mean, std = main
+        z = (np.asarray(features, dtype=np.float64) - mean) / std
+
+        distances, index = tree.query(z, k=min(k, len(X)))
+        index = np.atleast_1d(index)
+        distances = np.atleast_1d(distances)
+        rows = (X[index], y[index], source[index])
+
+        if buffer_z is not None:
+            delta = buffer_z - z
+            buffer_distances = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+            nearest = np.arange(len(buffer_distances))
+            if len(nearest) > k:
+                nearest = np.argpartition(buffer_distances, k)[:k]
+            distances = np.concatenate([distances, buffer_distances[nearest]])
+            rows = tuple(np.concatenate([a, b[nearest]]) for a, b in zip(rows, buffer))
+            order = np.argsort(distances, kind="stable")[:k]
+            distances = distances[order]
+            rows = tuple(column[order] for column in rows)
+
+        return distances, rows
+
+    def neighbours(self, features, k=5):
+        distances, rows = self.query(features, k)
+        if rows is None:
+            return {"k": 0, "neighbours": [], self.rate_key: None, "indexed": 0}
+
+        X, y, source = rows
+        neighbours = [
+            {
+                "distance": round(float(distance), 4),
+                "features": {
+                    f.name: int(v) if f.dtype == "int" else round(float(v), 2)
+                    for f, v in zip(self.schema.features, x)
+                },
+                self.outcome: bool(outcome),
+                "source": SOURCE_NAMES[source_code],
+            }
+            for distance, x, outcome, source_code in zip(distances, X, y, source)
+        ]
+        return {
+            "k": len(neighbours),
+            "neighbours": neighbours,
+            self.rate_key: round(float(y.mean()), 4),
+            "indexed": len(self),
+        }
+
+
+def build_index(name, cohorts=COHORTS):
+    """Index for "placement" or "performance", loaded from all its sources."""
+    outcome, rate_key, sources = INDEXES[name]
+    schema = cohorts[next(iter(sources))][1]
+    index = NeighbourIndex(schema, outcome, rate_key, cohorts)
+    index.refresh(sources)
+    return index
@@ -0,0 +1,219 @@
+import os
+import pickle
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from cohort_analytics import BASE_DIR, COHORTS, PREDICTION_LOG
+
+# --------------------------------------------------
+# TENANTS (ONE DIRECTORY PER COLLEGE)
+#   tenants/<id>/ mirrors the repo root: model.pkl, model.compact.npz,
+#   models/placement_model.*, *.reference.json, dataset/*.csv,
+#   student_predictions.csv and reports/. Train a tenant by running the
+#   training scripts from its directory. "default" is the repo root.
+# --------------------------------------------------
+TENANTS_DIR = os.environ.get("TENANTS_DIR", os.path.join(BASE_DIR, "tenants"))
+DEFAULT_TENANT = "default"
+TENANT_ID = re.compile(r"[a-z0-9][a-z0-9_-]{0,63}")
+# a tenant directory only counts once its models are trained
+REQUIRED_FILES = ("model.pkl", os.path.join("models", "placement_model.pkl"))
+
+
+def tenant_root(tenant):
+    return BASE_DIR if tenant == DEFAULT_TENANT else os.path.join(TENANTS_DIR, tenant)
+
+
+def tenant_exists(tenant):
+    if tenant == DEFAULT_TENANT:
+        return True
+    # the id pattern keeps tenant names from escaping TENANTS_DIR
+    if TENANT_ID.fullmatch(tenant) is None:
+        return False
+    root = tenant_root(tenant)
+    return all(os.path.isfile(os.path.join(root, name)) for name in REQUIRED_FILES)
+
+
+def known_tenants():
+    try:
+        names = sorted(name for name in os.listdir(TENANTS_DIR) if tenant_exists(name))
+    except OSError:
+        names = []
+    return [DEFAULT_TENANT] + [name for name in names if name != DEFAULT_TENANT]
+
+
+def tenant_path(tenant, path):
+    """The tenant's copy of ``path``, a file under the repo root."""
+    if tenant == DEFAULT_TENANT:
+        return path
+    return os.path.join(tenant_root(tenant), os.path.relpath(path, BASE_DIR))
+
+
+def tenant_log(tenant):
+    if tenant == DEFAULT_TENANT:
+        return PREDICTION_LOG
+    return os.path.join(tenant_root(tenant), "student_predictions.csv")
+
+
+def tenant_cohorts(tenant):
+    """cohort_analytics.COHORTS with the tenant's datasets and prediction log."""
+    if tenant == DEFAULT_TENANT:
+        return COHORTS
+    return {
+        name: (tenant_log(tenant) if path == PREDICTION_LOG else tenant_path(tenant, path), *rest)
+        for name, (path, *rest) in COHORTS.items()
+    }
+
+
+# --------------------------------------------------
+# TENANT REGISTRY (LRU, BOUNDED BY COUNT + MEMORY)
+# --------------------------------------------------
+def approx_nbytes(obj):
+    """Array bytes held by a scorer / table; pickled estimators by file size."""
+    if obj is None:
+        return 0
+    path = getattr(obj, "path", None)
+    if path and os.path.isfile(path):
+        return os.path.getsize(path)
+    total = 0
+    for value in vars(obj).values():
+        arrays = value if isinstance(value, (list, tuple)) else [value]
+        total += sum(a.nbytes for a in arrays if isinstance(a, np.ndarray))
+    return total
+
+
+class TenantUnavailable(Exception):
+    """A tenant's state failed to load (missing or mismatched artifacts)."""
+
+    def __init__(self, tenant, retry_after):
+        super().__init__(f"tenant {tenant!r} failed to load")
+        self.tenant = tenant
+        self.retry_after = retry_after
+
+
+class TenantRegistry:
+    """
+    Per-tenant state loaded on first use. Once more than ``max_tenants`` are
+    loaded, or their ``sizeof`` passes ``max_bytes``, the least recently
+    used unpinned tenants are dropped. A tenant that fails to load raises
+    TenantUnavailable and is not retried for ``retry_after`` seconds.
+    """
+
+    def __init__(self, load, sizeof, max_tenants=8, max_bytes=None, retry_after=30.0):
+        if max_tenants <= 0:
+            raise ValueError("max_tenants must be positive")
+        self.load = load
+        self.sizeof = sizeof
+        self.max_tenants = max_tenants
+        self.max_bytes = max_bytes
+        self.retry_after = retry_after
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # tenant -> (state, nbytes)
+        self._pinned = set()
+        self._loading = {}             # tenant -> lock held while it loads
+        self._failed = {}              # tenant -> monotonic time of the last failed load
+        self._lock = threading.Lock()
+
+    def _hit(self, tenant):
+        entry = self._entries.get(tenant)
+        if entry is None:
+            return None
+        self._entries.move_to_end(tenant)
+        self.hits += 1
+        return entry[0]
+
+    def get(self, tenant):
+        with self._lock:
+            state = self._hit(tenant)
+            if state is not None:
+                return state
+            self._check_failed(tenant)
+            loading = self._loading.setdefault(tenant, threading.Lock())
+
+        # load outside the registry lock so other tenants keep being served
+        with loading:
+            with self._lock:
+                state = self._hit(tenant)
+                if state is not None:
+                    return state
+                self._check_failed(tenant)
+            try:
+                state = self.load(tenant)
+            # missing, truncated or mismatched artifacts (SchemaMismatchError
+            # is a ValueError)
+            except (OSError, EOFError, ValueError, pickle.UnpicklingError) as e:
+                with self._lock:
+                    self._failed[tenant] = time.monotonic()
+                raise TenantUnavailable(tenant, self.retry_after) from e
+            nbytes = self.sizeof(state)
+            with self._lock:
+                self._entries[tenant] = (state, nbytes)
+                self._loading.pop(tenant, None)
+                self._failed.pop(tenant, None)
+                self.loads += 1
+                self._evict(keep=tenant)
+        return state
+
+    def _check_failed(self, tenant):
+        failed_at = self._failed.get(tenant)
+        if failed_at is not None:
+            remaining = self.retry_after - (time.monotonic() - failed_at)
+            if remaining > 0:
+                raise TenantUnavailable(tenant, remaining)
+
+    def peek(self, tenant):
+        """Loaded state or None, without loading or touching the LRU order."""
+        entry = self._entries.get(tenant)
+        return entry[0] if entry else None
+
+    def pin(self, tenant):
+        """Load and never evict (e.g. preloaded before forking workers)."""
+        state = self.get(tenant)
+        self._pinned.add(tenant)
+        return state
+
+    def resize(self, tenant):
+        """Re-measure a tenant after its state grew (e.g. an index was built)."""
+        with self._lock:
+            entry = self._entries.get(tenant)
+            if entry is not None:
+                self._entries[tenant] = (entry[0], self.sizeof(entry[0]))
+                self._evict(keep=tenant)
+
+    def nbytes(self):
+        return sum(nbytes for _, nbytes in self._entries.values())
+
+    def _evict(self, keep):
+        def over_budget():
+            if len(self._entries) > self.max_tenants:
+                return True
+            return self.max_bytes is not None and self.nbytes() > self.max_bytes
+
+        while over_budget():
+            victim = next(
+                (t for t in self._entries if t != keep and t not in self._pinned), None
+            )
+            if victim is None:
+                break  # only pinned tenants (and the one in use) left
+            del self._entries[victim]
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "loaded": {
+                    tenant: {"bytes": nbytes, "pinned": tenant in self._pinned}
+                    for tenant, (_, nbytes) in self._entries.items()
+                },
+                "max_tenants": self.max_tenants,
+                "max_bytes": self.max_bytes,
+                "bytes": self.nbytes(),
+                "hits": self.hits,
+                "loads": self.loads,
+                "evictions": self.evictions
+            }
@@ -1,7 +1,8 @@
-import pickle
+from feature_schema import PERFORMANCE_SCHEMA
+from model_bundle import load_bundle
 
 # STEP 1: Load the saved model
-model = pickle.load(open("model.pkl", "rb"))
+model = load_bundle("model.pkl", PERFORMANCE_SCHEMA)
 
 # STEP 2: Give sample student data
 # Format: [attendance, study_hours, internal_marks, assignment_score]
@@ -1,12 +1,19 @@
 import os
+import time
 
 os.makedirs("models", exist_ok=True)
 
 import pandas as pd
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import StratifiedKFold, cross_val_predict, train_test_split
 from sklearn.preprocessing import LabelEncoder
 from sklearn.linear_model import LogisticRegression
-import pickle
+
+from calibration import fit_calibration
+from drift_monitor import save_reference
+from feature_schema import PLACEMENT_SCHEMA
+from model_bundle import load_bundle, save_bundle
+from scorer import export_linear_scorer
+from training_report import staged_path, training_report
 
 # Load dataset
 data = pd.read_csv("dataset/placement_data.csv")
@@ -15,8 +22,13 @@ data = pd.read_csv("dataset/placement_data.csv")
 le = LabelEncoder()
 data["placed"] = le.fit_transform(data["placed"])  # Yes=1, No=0
 
-X = data.drop("placed", axis=1)
-y = data["placed"]
+# Keep only schema columns, in serving order, and drop out-of-range rows
+X = data[PLACEMENT_SCHEMA.columns]
+valid, errors = PLACEMENT_SCHEMA.validate_batch(X.to_numpy(dtype=float))
+if errors:
+    print(f"⚠️ Dropping {(~valid).sum()} invalid rows: {errors}")
+X = X[valid]
+y = data["placed"][valid]
 
 # Train-test split
 X_train, X_test, y_train, y_test = train_test_split(
@@ -25,10 +37,45 @@ X_train, X_test, y_train, y_test = train_test_split(
 
 # Train model
 model = LogisticRegression()
+fit_started = time.perf_counter()
 model.fit(X_train, y_train)
+fit_seconds = time.perf_counter() - fit_started
+
+# Calibrate on out-of-fold training predictions, stored as a piecewise-linear
+# table inside the bundle. Isotonic needs plenty of rows; Platt scaling is
+# steadier on small datasets.
+oof_probs = cross_val_predict(
+    LogisticRegression(), X_train, y_train,
+    cv=StratifiedKFold(n_splits=5, shuffle=True, random_state=42),
+    method="predict_proba"
+)[:, 1]
+calibration_method = os.environ.get("CALIBRATION_METHOD") or (
+    "isotonic" if len(y_train) >= 1000 else "platt"
+)
+calibration = fit_calibration(oof_probs, y_train, method=calibration_method)
+
+# Every artifact is written to a staged temp file first; training_report()
+# moves them into place only if the model is within its budgets
+artifacts = {
+    staged_path(path): path for path in (
+        "models/placement_model.pkl",
+        "models/placement_model.scorer.npz",
+        "models/placement_model.reference.json",
+    )
+}
+bundle_path, scorer_path, reference_path = artifacts
+
+# Save model bundle (estimator + feature schema + calibration + content hash)
+save_bundle(model, PLACEMENT_SCHEMA, bundle_path, calibration=calibration)
+
+# Portable numpy-only scorer used by the Streamlit apps
+export_linear_scorer(load_bundle(bundle_path, PLACEMENT_SCHEMA), scorer_path)
+
+# Training-input histograms for the live drift monitor (/api/drift);
+# every valid row of the dataset, as `python drift_monitor.py` writes it
+save_reference(X.to_numpy(dtype=float), PLACEMENT_SCHEMA, reference_path)
 
-# Save model
-with open("models/placement_model.pkl", "wb") as f:
-    pickle.dump(model, f)
+# Profile the staged artifact; publishes it, or exits non-zero if over budget
+training_report(bundle_path, PLACEMENT_SCHEMA, X_test, y_test, fit_seconds, publish=artifacts)
 
 print("✅ Placement model trained & saved successfully")
@@ -1,8 +1,15 @@
+import time
+
 import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import LabelEncoder
-import pickle
+
+from feature_schema import PERFORMANCE_SCHEMA
+from compact_forest import compact_forest, save_compact
+from drift_monitor import save_reference
+from model_bundle import load_bundle, save_bundle
+from training_report import staged_path, training_report
 
 # STEP 1: Load dataset
 data = pd.read_csv("dataset/student_data.csv")
@@ -12,8 +19,12 @@ le = LabelEncoder()
 data['result'] = le.fit_transform(data['result'])
 
 # STEP 3: Separate input and output
-X = data.drop(['name', 'result'], axis=1)
-y = data['result']
+X = data[PERFORMANCE_SCHEMA.columns]
+valid, errors = PERFORMANCE_SCHEMA.validate_batch(X.to_numpy(dtype=float))
+if errors:
+    print(f"⚠️ Dropping {(~valid).sum()} invalid rows: {errors}")
+X = X[valid]
+y = data['result'][valid]
 
 # STEP 4: Split data into training and testing
 X_train, X_test, y_train, y_test = train_test_split(
@@ -22,9 +33,30 @@ X_train, X_test, y_train, y_test = train_test_split(
 
 # STEP 5: Train the ML model
 model = RandomForestClassifier()
+fit_started = time.perf_counter()
 model.fit(X_train, y_train)
+fit_seconds = time.perf_counter() - fit_started
+
+# Every artifact is written to a staged temp file first; training_report()
+# moves them into place only if the model is within its budgets
+artifacts = {
+    staged_path(path): path for path in ("model.pkl", "model.compact.npz", "model.reference.json")
+}
+bundle_path, compact_path, reference_path = artifacts
+
+# STEP 6: Save the trained model bundle (estimator + feature schema + content hash)
+save_bundle(model, PERFORMANCE_SCHEMA, bundle_path)
+
+# STEP 6b: Write the compact forest served by app.py (identical predictions)
+bundle = load_bundle(bundle_path, PERFORMANCE_SCHEMA)
+save_compact(compact_forest(bundle, PERFORMANCE_SCHEMA, bundle_path), compact_path)
+
+# STEP 6c: Training-input histograms for the live drift monitor (/api/drift);
+# every valid row of the dataset, as `python drift_monitor.py` writes it
+save_reference(X.to_numpy(dtype=float), PERFORMANCE_SCHEMA, reference_path)
 
-# STEP 6: Save the trained model
-pickle.dump(model, open("model.pkl", "wb"))
+# STEP 7: Profile the staged model (fit time, size, latency, accuracy);
+# publishes it, or exits non-zero if any budget is exceeded
+training_report(bundle_path, PERFORMANCE_SCHEMA, X_test, y_test, fit_seconds, publish=artifacts)
 
 print("✅ Model trained successfully and saved!")
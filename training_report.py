@@ -0,0 +1,145 @@
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+from sklearn.metrics import accuracy_score, roc_auc_score
+
+from model_bundle import load_bundle
+
+# --------------------------------------------------
+# BUDGETS (override with TRAIN_BUDGET_<NAME>=value)
+# --------------------------------------------------
+DEFAULT_BUDGETS = {
+    "pickle_size_kb": 2048,
+    "loaded_memory_kb": 8192,
+    "single_row_p50_ms": 25.0,
+    "batch_per_row_us": 50.0,
+}
+
+BATCH_ROWS = 10_000
+SINGLE_ROW_REPEATS = 200
+
+
+def load_budgets(overrides=None):
+    budgets = dict(DEFAULT_BUDGETS, **(overrides or {}))
+    for name in budgets:
+        value = os.environ.get(f"TRAIN_BUDGET_{name.upper()}")
+        if value:
+            budgets[name] = float(value)
+    return budgets
+
+
+# --------------------------------------------------
+# MEASUREMENTS
+# --------------------------------------------------
+def measure_load(path, schema):
+    tracemalloc.start()
+    started = time.perf_counter()
+    bundle = load_bundle(path, schema)
+    load_ms = (time.perf_counter() - started) * 1000
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return bundle, load_ms, current / 1024
+
+
+def measure_latency(bundle, X):
+    row = np.ascontiguousarray(X[:1], dtype=np.float32)
+    bundle.predict_proba(row)  # warm up
+
+    timings = []
+    for _ in range(SINGLE_ROW_REPEATS):
+        started = time.perf_counter()
+        bundle.predict_proba(row)
+        timings.append(time.perf_counter() - started)
+
+    batch = np.ascontiguousarray(np.resize(X, (BATCH_ROWS, X.shape[1])), dtype=np.float32)
+    started = time.perf_counter()
+    bundle.predict_proba(batch)
+    batch_seconds = time.perf_counter() - started
+
+    return {
+        "single_row_p50_ms": round(float(np.percentile(timings, 50)) * 1000, 4),
+        "single_row_p99_ms": round(float(np.percentile(timings, 99)) * 1000, 4),
+        "batch_rows": BATCH_ROWS,
+        "batch_per_row_us": round(batch_seconds / BATCH_ROWS * 1e6, 4),
+    }
+
+
+def measure_quality(bundle, X_test, y_test):
+    X_test = np.asarray(X_test, dtype=np.float32)
+    y_test = np.asarray(y_test)
+    probs = bundle.predict_proba(X_test)[:, 1]
+    quality = {
+        "test_rows": int(len(y_test)),
+        "accuracy": round(float(accuracy_score(y_test, bundle.predict(X_test))), 4),
+        "roc_auc": None,
+    }
+    # ROC-AUC is undefined when the held-out split has a single class
+    if len(np.unique(y_test)) == 2:
+        quality["roc_auc"] = round(float(roc_auc_score(y_test, probs)), 4)
+    return quality
+
+
+# --------------------------------------------------
+# REPORT
+# --------------------------------------------------
+def staged_path(path):
+    """Temporary file next to ``path``; training_report() moves it into place."""
+    # per process, and created by the writer so it gets the usual permissions
+    return os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{os.getpid()}.tmp")
+
+
+def training_report(path, schema, X_test, y_test, fit_seconds, budgets=None, publish=None):
+    """Profile a saved bundle, write reports/<schema>_training_report.json
+    and exit non-zero when any budget is exceeded.
+
+    ``publish`` maps staged artifact paths (``path`` among them) to their
+    live paths; they are only moved into place when every budget passes,
+    so an over-budget model never replaces the deployed one.
+    """
+    publish = publish or {}
+    budgets = load_budgets(budgets)
+    bundle, load_ms, memory_kb = measure_load(path, schema)
+
+    report = {
+        "model": schema.name,
+        "artifact": publish.get(path, path),
+        "version": bundle.version,
+        "estimator": type(bundle.estimator).__name__,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "fit_seconds": round(fit_seconds, 4),
+        "pickle_size_kb": round(os.path.getsize(path) / 1024, 2),
+        "load_ms": round(load_ms, 3),
+        "loaded_memory_kb": round(memory_kb, 2),
+        **measure_latency(bundle, np.asarray(X_test, dtype=np.float32)),
+        **measure_quality(bundle, X_test, y_test),
+        "budgets": budgets,
+    }
+    report["over_budget"] = sorted(
+        name for name, limit in budgets.items() if report.get(name, 0) > limit
+    )
+
+    os.makedirs("reports", exist_ok=True)
+    report_path = os.path.join("reports", f"{schema.name}_training_report.json")
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"📄 Training report written to {report_path}")
+    if report["over_budget"]:
+        for name in report["over_budget"]:
+            print(f"❌ {name} = {report[name]} exceeds budget {budgets[name]}")
+        for staged in publish:
+            os.remove(staged)
+        if publish:
+            print("❌ Deployed artifacts left unchanged")
+        sys.exit(1)
+
+    # derived artifacts first, the pickle they were built from last; the
+    # loaders' source hash check covers the moment in between
+    for staged in sorted(publish, key=lambda staged: staged == path):
+        os.replace(staged, publish[staged])
+    return report
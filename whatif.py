@@ -0,0 +1,103 @@
+import math
+
+import numpy as np
+
+from feature_schema import PLACEMENT_SCHEMA
+from prediction_cache import PLACEMENT_DOMAINS
+
+
+# --------------------------------------------------
+# PLACEMENT FEATURES (MODEL COLUMN ORDER)
+# --------------------------------------------------
+PLACEMENT_FEATURES = tuple(PLACEMENT_SCHEMA.names)
+
+DOMAINS = dict(zip(PLACEMENT_FEATURES, PLACEMENT_DOMAINS))
+
+
+# --------------------------------------------------
+# GRID CONSTRUCTION
+# --------------------------------------------------
+def feature_axis(name, low=None, high=None):
+    dom_low, dom_high, step = DOMAINS[name]
+    low = dom_low if low is None else max(dom_low, low)
+    high = dom_high if high is None else min(dom_high, high)
+    if low > high:
+        raise ValueError(f"empty range for {name}")
+    # snap inward onto the domain's step grid (dom_low + k * step), so
+    # client bounds never produce off-grid values or overshoot high
+    first = math.ceil((low - dom_low) / step - 1e-9)
+    last = math.floor((high - dom_low) / step + 1e-9)
+    if first > last:
+        raise ValueError(f"empty range for {name}")
+    return np.round(dom_low + step * np.arange(first, last + 1), 6)
+
+
+def build_grid(base, vary, ranges=None):
+    """
+    Cross product of the varied feature axes, with every other feature
+    held at its value in ``base``. Returns (axes, grid) where grid has one
+    row per point in C order over the axes.
+    """
+    ranges = ranges or {}
+    axes = [feature_axis(name, *ranges.get(name, (None, None))) for name in vary]
+
+    mesh = np.meshgrid(*axes, indexing="ij")
+    grid = np.tile(np.asarray(base, dtype=float), (mesh[0].size, 1))
+    for name, values in zip(vary, mesh):
+        grid[:, PLACEMENT_FEATURES.index(name)] = values.ravel()
+
+    return axes, grid
+
+
+# --------------------------------------------------
+# SMALLEST CHANGE THAT CROSSES THE THRESHOLD
+# --------------------------------------------------
+def minimum_change(base, vary, axes, probs, threshold=0.5):
+    """
+    Grid point with prob >= threshold closest to ``base``, measured in
+    steps of each feature's domain. Ties go to the higher probability.
+    """
+    mesh = np.meshgrid(*axes, indexing="ij")
+    distance = np.zeros(probs.shape)
+    for name, values in zip(vary, mesh):
+        current = base[PLACEMENT_FEATURES.index(name)]
+        distance += np.abs(values - current) / DOMAINS[name][2]
+
+    crossing = probs >= threshold
+    if not crossing.any():
+        return None
+
+    distance = np.where(crossing, distance, np.inf)
+    candidates = np.flatnonzero(distance.ravel() == distance.min())
+    best = candidates[np.argmax(probs.ravel()[candidates])]
+    index = np.unravel_index(best, probs.shape)
+
+    return {
+        "changes": {
+            name: {
+                "from": base[PLACEMENT_FEATURES.index(name)],
+                "to": float(axis[i])
+            }
+            for name, axis, i in zip(vary, axes, index)
+        },
+        "probability": round(float(probs[index]) * 100, 2)
+    }
+
+
+# --------------------------------------------------
+# WHAT-IF SIMULATION
+# --------------------------------------------------
+def simulate(model, base, vary, ranges=None, threshold=0.5):
+    axes, grid = build_grid(base, vary, ranges)
+
+    # one batched model call for the whole surface plus the current profile
+    scored = model.calibrated_proba(np.vstack([grid, base]))
+    probs = scored[:-1].reshape([len(a) for a in axes])
+
+    return {
+        "vary": list(vary),
+        "axes": {name: axis.tolist() for name, axis in zip(vary, axes)},
+        "current_probability": round(float(scored[-1]) * 100, 2),
+        "surface": np.round(probs * 100, 2).tolist(),
+        "minimum_change": minimum_change(base, vary, axes, probs, threshold)
+    }